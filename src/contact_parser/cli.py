@@ -2,10 +2,12 @@ import argparse
 import json
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from .config import load_settings_from_file, setup_logging
 from .models import ParserSettings
+from .output import ResultSaver
 from .parser import ContactParser
 
 logger = logging.getLogger(__name__)
@@ -143,8 +145,7 @@ def save_to_json_file(data: dict, filepath: Path, quiet: bool = False):
         # Создаем директорию если её нет
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        ResultSaver.write_json(data, filepath)
 
         if not quiet:
             print(f"✓ Результаты сохранены в {filepath}", file=sys.stderr)
@@ -183,9 +184,16 @@ def process_url(url: str, settings: ParserSettings) -> dict:
         return {"url": url, "emails": [], "phones": []}
 
 
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """Возвращает парсер аргументов, созданный один раз на процесс"""
+
+    return create_parser()
+
+
 def main() -> None:
     """Основная функция CLI"""
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args()
 
     # Проверяем обязательные аргументы
@@ -211,7 +219,7 @@ def main() -> None:
         settings = load_settings(args)
 
         # TODO: Вывести информацию о настройках (только в verbose режиме)
-        if args.verbose:
+        if args.verbose and logger.isEnabledFor(logging.DEBUG):
             logger.debug(
                 f"Используемые настройки: "
                 f"max_pages={settings.max_pages}, "
@@ -226,8 +234,8 @@ def main() -> None:
                 print(f"Ошибка: Файл не найден: {args.batch}", file=sys.stderr)
                 sys.exit(1)
 
-            urls = args.batch.read_text(encoding="utf-8").strip().splitlines()
-            urls = [url.strip() for url in urls if url.strip()]
+            lines = args.batch.read_text(encoding="utf-8").splitlines()
+            urls = [url for url in map(str.strip, lines) if url]
 
             if not urls:
                 print("Ошибка: Файл не содержит валидных URL", file=sys.stderr)
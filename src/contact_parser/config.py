@@ -1,20 +1,92 @@
 import logging
+import logging.handlers
+import queue
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from .models import ParserSettings
 
 # Инициализируем логгер для этого модуля
 logger = logging.getLogger(__name__)
 
+# Логгеры сторонних библиотек, которые setup_logging приглушает до WARNING
+_SILENCED_LOGGERS = tuple(logging.getLogger(name) for name in ("urllib3", "requests", "lxml"))
+
+# Параметры последнего вызова setup_logging и установленные им обработчики
+_configured_logging: Optional[Tuple[tuple, Tuple[logging.Handler, ...]]] = None
+
+
+class _QueueFileHandler(logging.handlers.QueueHandler):
+    """
+    Пишет записи в файл через очередь и фоновый поток
+
+    Запись на диск выполняет QueueListener, поэтому вызывающий поток
+    не ждёт файлового ввода-вывода. flush() дожидается записи всего,
+    что уже в очереди, close() останавливает поток и закрывает файл.
+    """
+
+    def __init__(self, file_handler: logging.FileHandler):
+        super().__init__(queue.Queue())
+        self.file_handler = file_handler
+        self.listener = logging.handlers.QueueListener(self.queue, file_handler, respect_handler_level=True)
+        self.listener.start()
+        self._running = True
+
+    def flush(self) -> None:
+        if self._running:
+            self.queue.join()
+        self.file_handler.flush()
+
+    def close(self) -> None:
+        if self._running:
+            self._running = False
+            self.listener.stop()
+        self.file_handler.close()
+        super().close()
+
+
+def _close_queue_handlers(root_logger: logging.Logger) -> None:
+    """Останавливает фоновые потоки файлового логирования"""
+
+    for handler in root_logger.handlers:
+        if isinstance(handler, _QueueFileHandler):
+            handler.close()
+
+
+def reset_logging() -> None:
+    """Снимает все обработчики корневого логгера и возвращает уровень по умолчанию (WARNING)"""
+
+    global _configured_logging
+
+    root_logger = logging.getLogger()
+    _close_queue_handlers(root_logger)
+    root_logger.handlers.clear()
+    root_logger.setLevel(logging.WARNING)
+    _configured_logging = None
+
 
 def setup_logging(
     level: Optional[str] = None,
     log_file: Optional[str] = None,
     log_format: Optional[str] = None,
+    force: bool = False,
 ) -> None:
-    """Настраивает логирование для приложения"""
+    """
+    Настраивает логирование для приложения
+
+    Повторный вызов с теми же параметрами ничего не делает, пока обработчики
+    корневого логгера не менялись. force=True принудительно пересоздаёт их.
+    """
+    global _configured_logging
+
+    root_logger = logging.getLogger()
+    config_key = (level, str(log_file) if log_file else None, log_format, sys.stderr)
+    if not force and _configured_logging is not None:
+        last_key, last_handlers = _configured_logging
+        if last_key == config_key and tuple(root_logger.handlers) == last_handlers:
+            return
 
     if level:
         log_level = getattr(logging, str(level).upper(), None)
@@ -29,11 +101,9 @@ def setup_logging(
 
     formatter = logging.Formatter(log_format, datefmt="%Y-%m-%d %H:%M:%S")
 
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
-
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    _close_queue_handlers(root_logger)
+    root_logger.handlers.clear()
 
     stderr_handler = logging.StreamHandler(sys.stderr)
     stderr_handler.setFormatter(formatter)
@@ -48,12 +118,19 @@ def setup_logging(
             file_handler = logging.FileHandler(log_file, encoding="utf-8")
             file_handler.setFormatter(formatter)
             file_handler.setLevel(log_level)
-            root_logger.addHandler(file_handler)
+
+            # Запись в файл уходит в фоновый поток, остаток очереди
+            # дописывается при logging.shutdown() на выходе
+            queue_handler = _QueueFileHandler(file_handler)
+            queue_handler.setLevel(log_level)
+            root_logger.addHandler(queue_handler)
         except Exception as e:
             print(f"Ошибка файлового логирования: {e}", file=sys.stderr)
 
-    for lib in ["urllib3", "requests", "lxml"]:
-        logging.getLogger(lib).setLevel(logging.WARNING)
+    for lib_logger in _SILENCED_LOGGERS:
+        lib_logger.setLevel(logging.WARNING)
+
+    _configured_logging = (config_key, tuple(root_logger.handlers))
 
 
 def load_settings_from_env() -> ParserSettings:
@@ -72,6 +149,42 @@ def load_settings_from_env() -> ParserSettings:
         raise
 
 
+@lru_cache(maxsize=32)
+def _read_config_file(config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Читает и исполняет файл конфигурации.
+
+    Результат кэшируется по пути, времени изменения и размеру файла:
+    повторная загрузка неизменённого файла не читает и не исполняет его заново.
+
+    Returns:
+        Dict[str, Any]: Найденные в файле настройки
+    """
+    # Читаем содержимое файла
+    content = Path(config_file).read_text(encoding="utf-8")
+    if not content.strip():
+        raise ValueError(f"Конфигурационный файл пуст: {config_file}")
+
+    # Создаем локальное пространство имен
+    local_namespace = {}
+
+    try:
+        # Компилируем с настоящим именем файла, чтобы ошибки указывали на него
+        code = compile(content, config_file, "exec")
+        exec(code, {}, local_namespace)
+    except SyntaxError as e:
+        # Перехватываем синтаксические ошибки
+        raise ValueError(f"Синтаксическая ошибка в конфигурационном файле {config_file}: {e}")
+
+    # Ищем настройки в пространстве имен
+    settings_dict = {key: local_namespace[key] for key in ParserSettings.model_fields if key in local_namespace}
+
+    if not settings_dict:
+        raise ValueError(f"Не найдено настроек в файле {config_file}")
+
+    return settings_dict
+
+
 def load_settings_from_file(config_file: str) -> ParserSettings:
     """
     Загружает настройки из файла конфигурации
@@ -83,36 +196,16 @@ def load_settings_from_file(config_file: str) -> ParserSettings:
         ParserSettings: Настройки парсера
     """
     try:
+        # Абсолютный путь: один ключ кэша для любой записи пути и независимость от chdir
+        path = str(Path(config_file).resolve())
+
         # Проверяем существование файла
-        config_path = Path(config_file)
-        if not config_path.exists():
+        try:
+            stat = Path(path).stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Конфигурационный файл не найден: {config_file}")
 
-        # Читаем содержимое файла
-        content = config_path.read_text(encoding="utf-8")
-        if not content.strip():
-            raise ValueError(f"Конфигурационный файл пуст: {config_file}")
-
-        # Используем exec для загрузки настроек из файла (современный подход)
-        settings_dict = {}
-
-        # Создаем локальное пространство имен
-        local_namespace = {}
-
-        try:
-            # Выполняем код из файла
-            exec(content, {}, local_namespace)
-        except SyntaxError as e:
-            # Перехватываем синтаксические ошибки
-            raise ValueError(f"Синтаксическая ошибка в конфигурационном файле {config_file}: {e}")
-
-        # Ищем настройки в пространстве имен
-        for key in ParserSettings.model_fields.keys():
-            if key in local_namespace:
-                settings_dict[key] = local_namespace[key]
-
-        if not settings_dict:
-            raise ValueError(f"Не найдено настроек в файле {config_file}")
+        settings_dict = _read_config_file(path, stat.st_mtime_ns, stat.st_size)
 
         settings = ParserSettings(**settings_dict)
         logger.info(f"Настройки загружены из файла: {config_file}")
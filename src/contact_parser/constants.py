@@ -239,7 +239,7 @@ VALID_COUNTRY_CODES = {
 NOT_PHONE_PATTERNS = [
     r"^\d{1,6}$",  # Слишком короткие
     r"^\d{16,}$",  # Слишком длинные
-    r"^(\d)\1{5,}$",  # 6+ одинаковых цифр
+    r"^(?P<rep>\d)(?P=rep){5,}$",  # 6+ одинаковых цифр; группа именованная - паттерны сливаются в одну альтернацию
     r"^123456\d*$",  # Последовательности
     r"^234567\d*$",
     r"^345678\d*$",
@@ -254,7 +254,7 @@ NOT_PHONE_PATTERNS = [
 ]
 
 # Подозрительные начала номеров (часто ID товаров)
-SUSPICIOUS_STARTS = ["494", "443", "475", "476", "172", "173", "178", "179", "100", "200", "300", "400", "500"]
+SUSPICIOUS_STARTS = ("494", "443", "475", "476", "172", "173", "178", "179", "100", "200", "300", "400", "500")
 
 # ID-подобные паттерны
 ID_LIKE_PATTERNS = [
@@ -310,57 +310,61 @@ DOMAIN_COUNTRY_MAP = {
 # ============================================================================
 
 # Известные хорошие домены
-KNOWN_GOOD_EMAIL_DOMAINS = {
-    "gmail.com",
-    "googlemail.com",
-    "yahoo.com",
-    "yahoo.co.uk",
-    "ymail.com",
-    "outlook.com",
-    "hotmail.com",
-    "live.com",
-    "mail.ru",
-    "yandex.ru",
-    "yandex.com",
-    "protonmail.com",
-    "icloud.com",
-    "aol.com",
-    "zoho.com",
-    "bk.ru",
-    "list.ru",
-    "inbox.ru",
-    "rambler.ru",
-    "rumbler.ru",
-    "mail.ua",
-    "ukr.net",
-    "i.ua",
-}
+KNOWN_GOOD_EMAIL_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "googlemail.com",
+        "yahoo.com",
+        "yahoo.co.uk",
+        "ymail.com",
+        "outlook.com",
+        "hotmail.com",
+        "live.com",
+        "mail.ru",
+        "yandex.ru",
+        "yandex.com",
+        "protonmail.com",
+        "icloud.com",
+        "aol.com",
+        "zoho.com",
+        "bk.ru",
+        "list.ru",
+        "inbox.ru",
+        "rambler.ru",
+        "rumbler.ru",
+        "mail.ua",
+        "ukr.net",
+        "i.ua",
+    }
+)
 
 # Плохие домены (примеры, тестовые)
-BAD_EMAIL_DOMAINS = {
-    "example.com",
-    "example.ru",
-    "example.org",
-    "test.com",
-    "test.ru",
-    "test.org",
-    "domain.com",
-    "domain.ru",
-    "domain.org",
-    "email.com",
-    "email.ru",
-    "email.org",
-    "yoursite.com",
-    "yourdomain.com",
-    "localhost",
-    "localhost.localdomain",
-    "invalid.com",
-    "invalid.ru",
-    "sample.com",
-    "sample.ru",
-    "demo.com",
-    "demo.ru",
-}
+BAD_EMAIL_DOMAINS = frozenset(
+    {
+        "example.com",
+        "example.ru",
+        "example.org",
+        "test.com",
+        "test.ru",
+        "test.org",
+        "domain.com",
+        "domain.ru",
+        "domain.org",
+        "email.com",
+        "email.ru",
+        "email.org",
+        "yoursite.com",
+        "yourdomain.com",
+        "localhost",
+        "localhost.localdomain",
+        "invalid.com",
+        "invalid.ru",
+        "sample.com",
+        "sample.ru",
+        "demo.com",
+        "demo.ru",
+    }
+)
 
 # ============================================================================
 # ПАТТЕРНЫ ДЛЯ EMAIL
@@ -404,6 +408,34 @@ COUNTRY_PHONE_LENGTHS = {
     },
 }
 
+# ============================================================================
+# ФОРМАТЫ ЛОКАЛЬНЫХ НОМЕРОВ (БЕЗ +) ПО СТРАНАМ
+# ============================================================================
+
+# Коды мобильных операторов для 9-значных локальных номеров
+BY_LOCAL_PREFIXES = ("25", "29", "33", "44", "17")
+UA_LOCAL_PREFIXES = ("50", "66", "95", "99", "67", "68", "96", "97", "98", "63", "73", "93")
+
+# Код страны -> {длина номера: допустимые префиксы}; "" - любой префикс
+LOCAL_PHONE_FORMATS = {
+    "7": {  # Россия, Казахстан
+        10: ("9",),  # 9XXXXXXXXX
+        11: ("7", "8"),  # 7XXXXXXXXXX, 8XXXXXXXXXX
+    },
+    "375": {  # Беларусь
+        12: ("375",),  # 375XXXXXXXXX
+        9: BY_LOCAL_PREFIXES,  # 29XXXXXXX
+    },
+    "380": {  # Украина
+        12: ("380",),  # 380XXXXXXXXX
+        9: UA_LOCAL_PREFIXES,  # 50XXXXXXX
+    },
+    "1": {  # США, Канада
+        10: ("",),  # XXXXXXXXXX
+        11: ("1",),  # 1XXXXXXXXXX
+    },
+}
+
 # Минимальная и максимальная длина по умолчанию
 DEFAULT_MIN_LENGTH = 8
 DEFAULT_MAX_LENGTH = 15
@@ -143,6 +143,9 @@ class WebsiteCrawler:
         logger.info(f"Начинаем обход сайта: {start_url}")
         logger.info(f"Домен: {base_domain}, Максимальное количество страниц: {max_pages}")
 
+        # Интернирование результатов действует в пределах одного обхода
+        self.data_extractor.clear_interned()
+
         visited: Set[str] = set()
         to_visit: Set[str] = {start_url}
         results: List[dict] = []
@@ -1,7 +1,9 @@
 import logging
 import re
-from typing import Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Union
 
+from lxml import etree
 from lxml.html import HtmlElement
 
 from .models import ParserSettings
@@ -10,6 +12,31 @@ from .validators import EmailValidator, PhoneValidator
 
 logger = logging.getLogger(__name__)
 
+_META_REFRESH_URL_RE = re.compile(r"url=([^\s]+)", re.IGNORECASE)
+
+# XPath-выражения компилируются один раз на модуль, а не при каждом вызове.
+# Значения атрибутов нужны только как строки, поэтому smart_strings отключены
+_XP_MAILTO = etree.XPath('//a[starts-with(@href, "mailto:")]/@href', smart_strings=False)
+_XP_DATA_EMAIL = etree.XPath("//*[@data-email]/@data-email", smart_strings=False)
+_XP_TEL = etree.XPath('//a[starts-with(@href, "tel:")]/@href', smart_strings=False)
+_XP_DATA_PHONE = etree.XPath("//*[@data-phone]/@data-phone", smart_strings=False)
+_XP_META_PHONE = etree.XPath('//meta[@name="telephone" or @property="telephone"]/@content', smart_strings=False)
+_XP_LINKS = etree.XPath("//a[@href]")
+_XP_META_REFRESH = etree.XPath('//meta[@http-equiv="refresh"]/@content', smart_strings=False)
+_XP_CANONICAL = etree.XPath('//link[@rel="canonical"]/@href', smart_strings=False)
+
+# Встроенные паттерны телефонов (значение settings.phone_patterns по умолчанию)
+_DEFAULT_PHONE_PATTERNS = frozenset(
+    ParserSettings.model_fields["phone_patterns"].get_default(call_default_factory=True)
+)
+
+# Фрагмент для warmup(): задействует текст, mailto:, tel: и ссылки
+_WARMUP_HTML = (
+    "<html><body><p>Контакты: manager@gmail.com, +7 (999) 123-45-67</p>"
+    "<a href='mailto:manager@gmail.com'>email</a><a href='tel:+79991234567'>phone</a>"
+    "<a href='/contacts'>contacts</a></body></html>"
+)
+
 
 class DataExtractor:
     """Класс для извлечения данных с валидацией через единые валидаторы"""
@@ -27,21 +54,38 @@ class DataExtractor:
         self.email_pattern = re.compile(self.settings.email_pattern, re.IGNORECASE)
 
         # Паттерны телефонов - берём ТОЛЬКО из настроек!
-        self.phone_patterns = self.pattern_matcher.compile_patterns(self.settings.phone_patterns)
+        # re.ASCII только для встроенных паттернов: в них лишь \d и \s, и номер из
+        # цифр других письменностей всё равно не пройдёт нормализацию. Для
+        # пользовательских паттернов ASCII изменил бы \w, \b и IGNORECASE (кириллица)
+        self.phone_patterns = []
+        for pattern in self.settings.phone_patterns:
+            flags = re.IGNORECASE | re.ASCII if pattern in _DEFAULT_PHONE_PATTERNS else re.IGNORECASE
+            self.phone_patterns.extend(self.pattern_matcher.compile_patterns([pattern], flags))
 
         # НЕ СОЗДАЁМ своих паттернов! Используем настройки.
         # Если нужны дополнительные паттерны - добавляем их в settings.phone_patterns
 
-    def extract_from_html(self, html: str, current_url: str = "") -> dict:
+        # Таблица интернирования результатов: один и тот же email или телефон
+        # со всех страниц обхода хранится одним объектом строки. Ссылки не
+        # интернируются - они почти все уникальны. Таблица очищается в начале
+        # каждого обхода (WebsiteCrawler.crawl), чтобы не расти у долгоживущего экземпляра
+        self._interned: Dict[str, str] = {}
+
+    def extract_from_html(self, html: Union[str, bytes], current_url: str = "") -> dict:
         """
         Основной метод для извлечения данных из HTML
 
         Args:
-            html: HTML код страницы
+            html: HTML код страницы; bytes разбираются без декодирования в str,
+                кодировка берётся из <meta charset> документа
             current_url: URL текущей страницы (для контекстной валидации)
         """
         result = {"emails": set(), "phones": set(), "links": set()}
 
+        # Пустая страница: разбирать нечего, lxml на ней только выбросит ошибку
+        if not html or html.isspace():
+            return result
+
         try:
             # Парсим HTML
             tree = self.html_parser.parse_html(html)
@@ -53,25 +97,28 @@ class DataExtractor:
             text = self.html_parser.extract_text(tree)
 
             # 1. ИЗВЛЕКАЕМ EMAIL
-            result["emails"] = self._extract_emails(text, tree)
+            result["emails"] = self._intern(self._extract_emails(text, tree))
 
             # 2. ИЗВЛЕКАЕМ ТЕЛЕФОНЫ
             if self.settings.enable_phone_validation:
                 # С валидацией - передаём current_url для контекста домена
-                result["phones"] = self._extract_phones_with_validation(text, tree, current_url)
+                phones = self._extract_phones_with_validation(text, tree, current_url)
             else:
                 # Без валидации - просто собираем всё
-                result["phones"] = self._extract_phones_raw(text, tree)
+                phones = self._extract_phones_raw(text, tree)
+            result["phones"] = self._intern(phones)
 
             # 3. ИЗВЛЕКАЕМ ССЫЛКИ
             result["links"] = self._extract_links(tree)
 
-            logger.debug(
-                f"Страница {current_url}: "
-                f"найдено {len(result['emails'])} email, "
-                f"{len(result['phones'])} телефонов, "
-                f"{len(result['links'])} ссылок"
-            )
+            # Сообщение собирается только при включённом debug - метод вызывается на каждой странице
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Страница {current_url}: "
+                    f"найдено {len(result['emails'])} email, "
+                    f"{len(result['phones'])} телефонов, "
+                    f"{len(result['links'])} ссылок"
+                )
 
             return result
 
@@ -79,6 +126,51 @@ class DataExtractor:
             logger.error(f"Ошибка при извлечении данных из HTML: {e}")
             return result
 
+    def warmup(self) -> None:
+        """
+        Прогревает парсер на небольшом фрагменте HTML, чтобы разовые затраты
+        первого вызова (инициализация lxml, кэши валидаторов) не попадали
+        на первую реальную страницу обхода
+        """
+        self.extract_from_html(_WARMUP_HTML, current_url="https://example.ru")
+        # Служебные значения прогрева не должны оставаться в таблице интернирования
+        self.clear_interned()
+
+    def clear_interned(self) -> None:
+        """Очищает таблицу интернирования результатов"""
+
+        self._interned.clear()
+
+    def _intern(self, values: Iterable[str]) -> Set[str]:
+        """Заменяет строки на ранее встреченные равные им объекты"""
+
+        intern = self._interned.setdefault
+        return {intern(value, value) for value in values}
+
+    def extract_batch(self, htmls: List[str], urls: Optional[List[str]] = None) -> List[dict]:
+        """
+        Извлекает данные из нескольких HTML-документов в пуле потоков
+
+        Args:
+            htmls: HTML код страниц
+            urls: URL страниц в том же порядке (для контекстной валидации)
+
+        Returns:
+            List[dict]: Результаты extract_from_html в порядке входных документов
+        """
+        if urls is None:
+            urls = [""] * len(htmls)
+        elif len(urls) != len(htmls):
+            raise ValueError(f"Передано {len(htmls)} HTML-документов, но {len(urls)} URL")
+
+        if len(htmls) <= 1:
+            return [self.extract_from_html(html, url) for html, url in zip(htmls, urls)]
+
+        # Разбор lxml отпускает GIL, поэтому потоков достаточно
+        workers = min(self.settings.max_workers, len(htmls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.extract_from_html, htmls, urls))
+
     def _extract_emails(self, text: str, tree: HtmlElement) -> Set[str]:
         """Извлекает email адреса"""
 
@@ -86,14 +178,10 @@ class DataExtractor:
 
         try:
             # 1. Ищем в тексте страницы
-            found_emails = self.email_pattern.findall(text)
-            for email in found_emails:
-                clean_email = email.strip()
-                if clean_email:
-                    emails.add(clean_email)
+            emails.update(email for email in map(str.strip, self.email_pattern.findall(text)) if email)
 
             # 2. Ищем в mailto: ссылках
-            mailto_links = tree.xpath('//a[starts-with(@href, "mailto:")]/@href')
+            mailto_links = _XP_MAILTO(tree)
             for mailto in mailto_links:
                 # Извлекаем email из mailto:email@domain.com
                 email = mailto.replace("mailto:", "").strip()
@@ -104,10 +192,7 @@ class DataExtractor:
 
             # 3. Ищем в data-атрибутах и других местах (опционально)
             if tree is not None:
-                data_emails = tree.xpath("//*[@data-email]/@data-email")
-                for email in data_emails:
-                    if email and "@" in email:
-                        emails.add(email)
+                emails.update(email for email in _XP_DATA_EMAIL(tree) if email and "@" in email)
 
         except Exception as e:
             logger.error(f"Ошибка при извлечении email: {e}")
@@ -135,7 +220,7 @@ class DataExtractor:
             phones.update(self.pattern_matcher.find_all_matches(text, self.phone_patterns))
 
             # 2. Ищем в tel: ссылках
-            tel_links = tree.xpath('//a[starts-with(@href, "tel:")]/@href')
+            tel_links = _XP_TEL(tree)
             for tel in tel_links:
                 phone = tel.replace("tel:", "").strip()
                 phone = phone.split("?")[0].split("&")[0]
@@ -143,23 +228,18 @@ class DataExtractor:
                     phones.add(phone)
 
             # 3. Ищем в атрибутах data-phone
-            data_phones = tree.xpath("//*[@data-phone]/@data-phone")
-            for phone in data_phones:
-                if phone:
-                    phones.add(phone)
+            phones.update(filter(None, _XP_DATA_PHONE(tree)))
 
             # 4. Ищем в meta тегах с телефонами
-            meta_phones = tree.xpath('//meta[@name="telephone" or @property="telephone"]/@content')
-            for phone in meta_phones:
-                if phone:
-                    phones.add(phone)
+            phones.update(filter(None, _XP_META_PHONE(tree)))
 
         except Exception as e:
             logger.error(f"Ошибка при извлечении телефонов: {e}")
 
         validated_phones = self.phone_validator.validate_and_normalize_phones(phones, current_url)
 
-        logger.debug(f"Извлечено {len(phones)} сырых номеров, после валидации: {len(validated_phones)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Извлечено {len(phones)} сырых номеров, после валидации: {len(validated_phones)}")
 
         return set(validated_phones)
 
@@ -173,7 +253,7 @@ class DataExtractor:
             phones.update(self.pattern_matcher.find_all_matches(text, self.phone_patterns))
 
             # Ищем в tel ссылках
-            tel_links = tree.xpath('//a[starts-with(@href, "tel:")]/@href')
+            tel_links = _XP_TEL(tree)
             for tel in tel_links:
                 phone = tel.replace("tel:", "").strip()
                 phones.add(phone)
@@ -197,23 +277,20 @@ class DataExtractor:
         links = set()
 
         try:
-            link_elements = tree.xpath("//a[@href]")
+            link_elements = _XP_LINKS(tree)
             for element in link_elements:
                 href = element.get("href", "").strip()
                 if href and not href.startswith(("#", "javascript:", "mailto:", "tel:", "data:")):
                     links.add(href)
 
             # Ссылки в meta refresh
-            meta_refresh = tree.xpath('//meta[@http-equiv="refresh"]/@content')
+            meta_refresh = _XP_META_REFRESH(tree)
             for content in meta_refresh:
-                url_match = re.search(r"url=([^\s]+)", content, re.IGNORECASE)
+                url_match = _META_REFRESH_URL_RE.search(content)
                 if url_match:
                     links.add(url_match.group(1))
 
-            canonical = tree.xpath('//link[@rel="canonical"]/@href')
-            for link in canonical:
-                if link:
-                    links.add(link)
+            links.update(filter(None, _XP_CANONICAL(tree)))
 
         except Exception as e:
             logger.error(f"Ошибка при извлечении ссылок: {e}")
@@ -12,23 +12,14 @@ class ContactInfo(BaseModel):
     @field_validator("emails")
     def validate_emails_list(cls, emails: List[str]) -> List[str]:
         """Более мягкая валидация email"""
-        results = []
-        for email in emails:
-            # Простая проверка на наличие @
-            if "@" in email and "." in email.split("@")[1]:
-                results.append(email.lower().strip())
-        return results
+        # Простая проверка на наличие @ и точки в домене
+        return [email.lower().strip() for email in emails if "@" in email and "." in email.partition("@")[2]]
 
     @field_validator("phones")
     def validate_phones_list(cls, phones: List[str]) -> List[str]:
         """Более мягкая валидация телефонов"""
-        results = []
-        for phone in phones:
-            # Простая проверка: содержит цифры и имеет разумную длину
-            digits = "".join(filter(str.isdigit, phone))
-            if 6 <= len(digits) <= 15:
-                results.append(phone.strip())
-        return results
+        # Простая проверка: содержит цифры и имеет разумную длину
+        return [phone.strip() for phone in phones if 6 <= sum(map(str.isdigit, phone)) <= 15]
 
 
 class ParserSettings(BaseSettings):
@@ -19,16 +19,7 @@ class ResultSaver:
         # Создаем директорию если её нет
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Добавляем метаданные
-        result_with_meta = result.copy()
-        result_with_meta["_metadata"] = {
-            "generated_at": datetime.now().isoformat(),
-            "parser_version": "2.0.0",
-        }
-
-        # Сохраняем в JSON
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result_with_meta, f, ensure_ascii=False, indent=2)
+        ResultSaver.write_json(ResultSaver._with_metadata(result), output_path)
 
     @staticmethod
     def save_batch_results(results: List[Dict[str, Any]], output_dir: Path) -> None:
@@ -59,8 +50,8 @@ class ResultSaver:
             else:
                 filename = f"error_{i + 1}.json"
 
-            filepath = output_dir / filename
-            ResultSaver.save_single_result(result, filepath)
+            # Директория уже создана - пишем напрямую, без mkdir на каждый файл
+            ResultSaver.write_json(ResultSaver._with_metadata(result), output_dir / filename)
 
         # Также сохраняем сводный файл
         summary = {
@@ -82,9 +73,27 @@ class ResultSaver:
             },
         }
 
-        summary_file = output_dir / "summary.json"
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        ResultSaver.write_json(summary, output_dir / "summary.json")
+
+    @staticmethod
+    def _with_metadata(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Возвращает копию результата с добавленными метаданными"""
+
+        result_with_meta = result.copy()
+        result_with_meta["_metadata"] = {
+            "generated_at": datetime.now().isoformat(),
+            "parser_version": "2.0.0",
+        }
+        return result_with_meta
+
+    @staticmethod
+    def write_json(data: Dict[str, Any], path: Path) -> None:
+        """Кодирует данные целиком и пишет их в файл одним вызовом"""
+
+        # json.dump с indent делает отдельную запись на каждый фрагмент JSON
+        content = json.dumps(data, ensure_ascii=False, indent=2)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
 
     @staticmethod
     def save_to_directory(result: Dict[str, Any], output_dir: Path, filename: str = None) -> Path:
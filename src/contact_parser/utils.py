@@ -1,13 +1,20 @@
 import logging
 import re
-from typing import List, Optional, Pattern, Set
+from functools import lru_cache
+from typing import List, Optional, Pattern, Set, Union
 from urllib.parse import urljoin, urlparse
 
-from lxml.etree import ParserError
+from lxml.etree import ParserError, XPath
 from lxml.html import HtmlElement, fromstring
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# XPath-выражения компилируются один раз, а не при каждом вызове tree.xpath()
+_XP_HREFS = XPath("//a/@href", smart_strings=False)
+_XP_NON_CONTENT = XPath("//script | //style | //noscript")
+
 
 class URLNormalizer:
     """Класс для нормализации и валидации URL с использованием lxml"""
@@ -46,8 +53,12 @@ class URLNormalizer:
             return None
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def is_same_domain(url: str, base_domain: str) -> bool:
-        """Проверяет, принадлежит ли URL тому же домену"""
+        """
+        Проверяет, принадлежит ли URL тому же домену.
+        Результат кэшируется: ссылки из меню и подвала повторяются на каждой странице
+        """
 
         if not url or not url.strip():
             return False
@@ -75,6 +86,7 @@ class URLNormalizer:
             return False
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def get_domain(url: str) -> Optional[str]:
         """Извлекает домен из URL"""
 
@@ -98,8 +110,11 @@ class HTMLParser:
     """Класс для парсинга HTML с использованием lxml"""
 
     @staticmethod
-    def parse_html(html: str) -> Optional[HtmlElement]:
-        """Парсит HTML строку в lxml дерево"""
+    def parse_html(html: Union[str, bytes]) -> Optional[HtmlElement]:
+        """
+        Парсит HTML в lxml дерево.
+        bytes передаются в lxml как есть - кодировку он определяет сам по <meta charset>
+        """
 
         try:
             return fromstring(html)
@@ -120,7 +135,7 @@ class HTMLParser:
         try:
             text = tree.text_content()
             # Убираем лишние пробелы и переносы
-            text = re.sub(r"\s+", " ", text).strip()
+            text = _WHITESPACE_RE.sub(" ", text).strip()
             return text
         except Exception as e:
             logger.error(f"Ошибка при извлечении текста: {e}")
@@ -137,12 +152,13 @@ class HTMLParser:
 
         try:
             # Находим все ссылки с помощью XPath
-            for link_element in tree.xpath("//a[@href]"):
-                href = link_element.get("href", "").strip()
+            for href in _XP_HREFS(tree):
+                href = href.strip()
                 if href:
                     links.add(href)
 
-            logger.debug(f"Извлечено {len(links)} ссылок из HTML")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Извлечено {len(links)} ссылок из HTML")
             return links
 
         except Exception as e:
@@ -157,7 +173,7 @@ class HTMLParser:
             tree = fromstring(html)
 
             # Удаляем скрипты и стили
-            for element in tree.xpath("//script | //style | //noscript"):
+            for element in _XP_NON_CONTENT(tree):
                 element.getparent().remove(element)
 
             # Возвращаем очищенный HTML
@@ -172,13 +188,13 @@ class PatternMatcher:
     """Класс для работы с регулярными выражениями"""
 
     @staticmethod
-    def compile_patterns(patterns: List[str]) -> List[Pattern]:
+    def compile_patterns(patterns: List[str], flags: int = re.IGNORECASE) -> List[Pattern]:
         """Компилирует список регулярных выражений"""
 
         compiled = []
         for pattern in patterns:
             try:
-                compiled.append(re.compile(pattern, re.IGNORECASE))
+                compiled.append(re.compile(pattern, flags))
             except re.error as e:
                 logger.error(f"Ошибка компиляции паттерна {pattern}: {e}")
         return compiled
@@ -1,6 +1,8 @@
 import logging
 import re
-from typing import List, Optional, Set
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from . import constants
@@ -8,6 +10,114 @@ from . import constants
 logger = logging.getLogger(__name__)
 
 
+class _DigitsOnlyTable(dict):
+    """Таблица для str.translate: оставляет десятичные цифры, удаляет остальное.
+
+    Заполняется лениво, поэтому корректно обрабатывает любые символы Unicode.
+    """
+
+    def __missing__(self, code: int) -> Optional[int]:
+        value = code if chr(code).isdecimal() else None
+        self[code] = value
+        return value
+
+
+_DIGITS_ONLY = _DigitsOnlyTable()
+
+
+# NOT_PHONE паттерны объединены в одну альтернацию - один вызов match вместо цикла
+_NOT_PHONE_RE = re.compile("|".join(f"(?:{pattern})" for pattern in constants.NOT_PHONE_PATTERNS))
+
+# Все 6-значные последовательности по модулю 10: 20 возрастающих и убывающих,
+# объединённые в одну альтернацию, чтобы номер просматривался за один проход
+_SEQUENTIAL_RE = re.compile(
+    "|".join("".join(str((start + step * i) % 10) for i in range(6)) for step in (1, -1) for start in range(10))
+)
+
+
+@lru_cache(maxsize=256)
+def _get_tld(url: str) -> Optional[str]:
+    """Возвращает доменную зону URL (кэшируется: все номера страницы приходят с одним URL)"""
+
+    try:
+        netloc = urlparse(url).netloc
+    except Exception:
+        return None
+
+    _, dot, tld = netloc.rpartition(".")
+    if not dot:
+        return None
+    # Интернированная строка совпадает по identity с ключами DOMAIN_COUNTRY_MAP
+    return sys.intern(tld.lower())
+
+
+def _build_local_validator(formats: Dict[int, Tuple[str, ...]]) -> Callable[[str], bool]:
+    """Строит специализированную проверку локального номера для одной страны"""
+
+    def is_valid_local(digits: str) -> bool:
+        prefixes = formats.get(len(digits))
+        return prefixes is not None and digits.startswith(prefixes)
+
+    return is_valid_local
+
+
+def _build_country_valid_lengths() -> Dict[str, FrozenSet[int]]:
+    """Собирает допустимые длины номера по коду страны из constants.COUNTRY_PHONE_LENGTHS"""
+
+    return {
+        code: frozenset(standards.values())
+        for code, standards in getattr(constants, "COUNTRY_PHONE_LENGTHS", {}).items()
+    }
+
+
+# Нормализаторы локальных номеров (без +) в формат E.164 по коду страны домена.
+# Длина номера для страны уже проверена вызывающим кодом
+def _normalize_local_ru(digits: str) -> Optional[str]:
+    """Россия, Казахстан"""
+
+    length = len(digits)
+    if length == 10 and digits.startswith("9"):
+        return "+7" + digits
+    if length == 11 and digits.startswith("8"):
+        return "+7" + digits[1:]
+    if length == 11 and digits.startswith("7"):
+        return "+" + digits
+    return None
+
+
+def _normalize_local_by(digits: str) -> Optional[str]:
+    """Беларусь"""
+
+    length = len(digits)
+    if length == 12 and digits.startswith("375"):
+        return "+" + digits
+    if length == 9 and digits.startswith(constants.BY_LOCAL_PREFIXES):
+        return "+375" + digits
+    return None
+
+
+def _normalize_local_ua(digits: str) -> Optional[str]:
+    """Украина"""
+
+    length = len(digits)
+    if length == 12 and digits.startswith("380"):
+        return "+" + digits
+    if length == 9:
+        return "+380" + digits
+    return None
+
+
+def _normalize_local_us(digits: str) -> Optional[str]:
+    """США, Канада"""
+
+    length = len(digits)
+    if length == 10:
+        return "+1" + digits
+    if length == 11 and digits.startswith("1"):
+        return "+" + digits
+    return None
+
+
 class PhoneValidator:
     """Универсальный класс для проверки и нормализации телефонных номеров"""
 
@@ -19,7 +129,34 @@ class PhoneValidator:
     NOT_PHONE_PATTERNS = constants.NOT_PHONE_PATTERNS
     SUSPICIOUS_STARTS = constants.SUSPICIOUS_STARTS
     ID_LIKE_PATTERNS = constants.ID_LIKE_PATTERNS
+    # Коды стран, сгруппированные по длине (от длинных к коротким) для поиска префикса
+    COUNTRY_CODES_BY_LENGTH = tuple(
+        (length, frozenset(code for code in constants.VALID_COUNTRY_CODES if len(code) == length))
+        for length in sorted({len(code) for code in constants.VALID_COUNTRY_CODES}, reverse=True)
+    )
     DOMAIN_COUNTRY_MAP = constants.DOMAIN_COUNTRY_MAP
+    # Допустимые длины номера по коду страны (пересобираются в clear_caches)
+    COUNTRY_VALID_LENGTHS = _build_country_valid_lengths()
+    LOCAL_VALIDATORS = {
+        code: _build_local_validator(formats) for code, formats in constants.LOCAL_PHONE_FORMATS.items()
+    }
+    LOCAL_NORMALIZERS = {
+        "7": _normalize_local_ru,
+        "375": _normalize_local_by,
+        "380": _normalize_local_ua,
+        "1": _normalize_local_us,
+    }
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """
+        Сбрасывает кэши проверок номеров и пересобирает длины по странам.
+        Вызывается после изменения constants во время работы
+        """
+        cls.COUNTRY_VALID_LENGTHS = _build_country_valid_lengths()
+        cls._check_cleaned_cached.cache_clear()
+        cls._validate_cleaned_cached.cache_clear()
+        cls._normalize_cleaned.cache_clear()
 
     @classmethod
     def _clean_phone(cls, phone: str) -> str:
@@ -28,11 +165,17 @@ class PhoneValidator:
         if not phone:
             return ""
 
+        # Быстрый путь: номер уже очищен (tel:-ссылки, микроразметка)
+        if phone.isdecimal():
+            return phone
+        if phone[0] == "+" and phone[1:].isdecimal():
+            return phone
+
         # Сохраняем плюс только если он в начале
         has_plus = phone.strip().startswith("+")
 
         # Удаляем все нецифровые символы
-        digits = re.sub(r"[^\d]", "", phone)
+        digits = phone.translate(_DIGITS_ONLY)
 
         if not digits:
             return ""
@@ -53,162 +196,182 @@ class PhoneValidator:
         if not cleaned:
             return False
 
+        # В debug-режиме сообщения ссылаются на исходную запись номера,
+        # поэтому проверка выполняется полностью, без кэша
+        if logger.isEnabledFor(logging.DEBUG):
+            return cls._check_cleaned(phone, cleaned, home_code=cls._get_home_code(current_url))
+
+        # Быстрый отсев по длине: не разбираем URL и не засоряем кэш
+        # заведомо неподходящими строками (ID, timestamp, короткие числа)
+        if not cls._has_phone_length(cleaned):
+            return False
+        return cls._check_cleaned_cached(cleaned, cls._get_home_code(current_url))
+
+    @staticmethod
+    def _has_phone_length(cleaned: str) -> bool:
+        """Проверяет, что в очищенном номере от 7 до 15 цифр"""
+
+        return 7 <= len(cleaned) - (cleaned[0] == "+") <= 15
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _check_cleaned_cached(cls, cleaned: str, home_code: Optional[str]) -> bool:
+        """Кэшируемая проверка очищенного номера (используется без debug-логов)"""
+
+        return cls._check_cleaned(cleaned, cleaned, home_code)
+
+    @classmethod
+    def _check_cleaned(cls, phone: str, cleaned: str, home_code: Optional[str]) -> bool:
+        """
+        Проверки is_likely_phone для очищенного номера.
+        phone - исходная запись, используется только в debug-сообщениях.
+        """
         digits = cleaned.lstrip("+")
         has_plus = cleaned.startswith("+")
 
         # --- 1. БАЗОВАЯ ДЛИНА ---
         if len(digits) < 7 or len(digits) > 15:
-            logger.debug(f"Phone {phone}: invalid length {len(digits)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: invalid length {len(digits)}")
+            return False
+
+        # --- 2-5. ОБЩИЕ ПРОВЕРКИ НА "НЕ-ТЕЛЕФОН" ---
+        if not cls._passes_sanity_checks(phone, digits, has_plus):
+            return False
+
+        # ========== ВАЛИДАЦИЯ МЕЖДУНАРОДНЫХ (+Х ХХХ) ==========
+        if has_plus:
+            country_code = cls._find_country_code(digits)
+            if not country_code:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Phone {phone}: invalid country code")
+                return False
+
+            return cls._is_likely_international(phone, digits, country_code, home_code)
+
+        # ========== ВАЛИДАЦИЯ ЛОКАЛЬНЫХ (БЕЗ +) ==========
+        if not home_code:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: no domain context, rejecting")
+            return False
+
+        # ПРОВЕРКА ДЛИНЫ ДЛЯ ЛОКАЛЬНЫХ НОМЕРОВ
+        if not cls._is_valid_length_for_country(digits, home_code, has_plus=False):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: invalid local length {len(digits)} for country {home_code}")
+            return False
+
+        # Специализированная проверка формата для страны домена
+        local_validator = cls.LOCAL_VALIDATORS.get(home_code)
+        if local_validator is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: no matching format for country code {home_code}")
             return False
 
+        if not local_validator(digits):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: invalid local format for country {home_code}")
+            return False
+
+        return True
+
+    @classmethod
+    def _passes_sanity_checks(cls, phone: str, digits: str, has_plus: bool) -> bool:
+        """
+        Отсеивает явные не-телефоны: ID, последовательности, повторы, нули.
+        Ожидает, что длина digits уже проверена (7-15 цифр).
+        """
+
         # --- 2. ЯВНЫЕ НЕ-ТЕЛЕФОНЫ ---
-        for pattern_str in cls.NOT_PHONE_PATTERNS:
-            if re.match(pattern_str, digits):
+        if _NOT_PHONE_RE.match(digits):
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Phone {phone}: matched NOT_PHONE pattern")
-                return False
+            return False
 
         # --- 3. ПОДОЗРИТЕЛЬНЫЕ НАЧАЛА ---
         if not has_plus and len(digits) >= 10:
-            if any(digits.startswith(start) for start in cls.SUSPICIOUS_STARTS):
-                logger.debug(f"Phone {phone}: suspicious start")
+            if digits.startswith(cls.SUSPICIOUS_STARTS):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Phone {phone}: suspicious start")
                 return False
 
         # --- 4. УНИКАЛЬНЫЕ ЦИФРЫ ---
         if len(set(digits)) < 3:
-            logger.debug(f"Phone {phone}: too few unique digits")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: too few unique digits")
             return False
 
         # --- 5. СЛИШКОМ МНОГО НУЛЕЙ ---
         zero_ratio = digits.count("0") / len(digits)
         if zero_ratio > 0.6:
-            logger.debug(f"Phone {phone}: too many zeros ({zero_ratio:.1%})")  # noqa E231
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: too many zeros ({zero_ratio:.1%})")  # noqa E231
             return False
 
-        # --- 6. ПОЛУЧАЕМ КОД СТРАНЫ ИЗ ДОМЕНА ---
-        home_code = None
-        if current_url:
-            try:
-                domain_parts = urlparse(current_url).netloc.split(".")
-                if len(domain_parts) >= 2:
-                    tld = domain_parts[-1].lower()
-                    home_code = cls.DOMAIN_COUNTRY_MAP.get(tld)
-            except Exception:
-                pass
-
-        # ========== ВАЛИДАЦИЯ МЕЖДУНАРОДНЫХ (+Х ХХХ) ==========
-        if has_plus:
-            country_code = None
-            for code in sorted(cls.VALID_COUNTRY_CODES, key=len, reverse=True):
-                if digits.startswith(code):
-                    country_code = code
-                    break
-
-            if not country_code:
-                logger.debug(f"Phone {phone}: invalid country code")
-                return False
-
-            # ПРОВЕРКА ДЛЯ РФ: Код города/оператора не может начинаться с 0, 1, 2
-            if country_code == "7" and len(digits) > 1:
-                if digits[1] in "012":
-                    logger.debug(f"Phone {phone}: Russian code cannot start with {digits[1]}")
-                    return False
+        return True
 
-            # ПРОВЕРКА ДЛИНЫ ПО СТРАНЕ
-            if not cls._is_valid_length_for_country(digits, country_code, has_plus=True):
-                logger.debug(f"Phone {phone}: invalid length {len(digits)} for country {country_code}")
-                return False
+    @classmethod
+    def _get_home_code(cls, current_url: str) -> Optional[str]:
+        """Определяет код страны по доменной зоне URL"""
 
-            # Для .ru домена ТОЛЬКО +7
-            if home_code == "7" and not digits.startswith("7"):
-                logger.debug(f"Phone {phone}: not Russian format for .ru domain")
-                return False
+        if not current_url:
+            return None
 
-            return True
+        tld = _get_tld(current_url)
+        if not tld:
+            return None
+        return cls.DOMAIN_COUNTRY_MAP.get(tld)
 
-        # ========== ВАЛИДАЦИЯ ЛОКАЛЬНЫХ (БЕЗ +) ==========
-        if not home_code:
-            logger.debug(f"Phone {phone}: no domain context, rejecting")
-            return False
+    @classmethod
+    def _find_country_code(cls, digits: str) -> Optional[str]:
+        """Находит код страны в начале международного номера"""
 
-        # ПРОВЕРКА ДЛИНЫ ДЛЯ ЛОКАЛЬНЫХ НОМЕРОВ
-        if not cls._is_valid_length_for_country(digits, home_code, has_plus=False):
-            logger.debug(f"Phone {phone}: invalid local length {len(digits)} for country {home_code}")
-            return False
+        for length, codes in cls.COUNTRY_CODES_BY_LENGTH:
+            prefix = digits[:length]
+            if prefix in codes:
+                return prefix
+        return None
 
-        # --- РОССИЯ ---
-        if home_code == "7":
-            if len(digits) == 10 and digits.startswith("9"):
-                return True
-            if len(digits) == 11 and digits[0] in "78":
-                return True
-            logger.debug(f"Phone {phone}: invalid Russian format")
-            return False
+    @classmethod
+    def _is_likely_international(cls, phone: str, digits: str, country_code: str, home_code: Optional[str]) -> bool:
+        """Проверки международного номера с уже определённым кодом страны"""
 
-        # --- БЕЛАРУСЬ ---
-        elif home_code == "375":
-            if len(digits) == 12 and digits.startswith("375"):
-                return True
-            if len(digits) == 9 and digits[:2] in ["25", "29", "33", "44", "17"]:
-                return True
-            logger.debug(f"Phone {phone}: invalid Belarusian format")
-            return False
+        # ПРОВЕРКА ДЛЯ РФ: Код города/оператора не может начинаться с 0, 1, 2
+        if country_code == "7" and len(digits) > 1:
+            if digits[1] in "012":
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Phone {phone}: Russian code cannot start with {digits[1]}")
+                return False
 
-        # --- УКРАИНА ---
-        elif home_code == "380":
-            if len(digits) == 12 and digits.startswith("380"):
-                return True
-            if len(digits) == 9 and digits[:2] in [
-                "50",
-                "66",
-                "95",
-                "99",
-                "67",
-                "68",
-                "96",
-                "97",
-                "98",
-                "63",
-                "73",
-                "93",
-            ]:
-                return True
-            logger.debug(f"Phone {phone}: invalid Ukrainian format")
+        # ПРОВЕРКА ДЛИНЫ ПО СТРАНЕ
+        if not cls._is_valid_length_for_country(digits, country_code, has_plus=True):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: invalid length {len(digits)} for country {country_code}")
             return False
 
-        # --- США/КАНАДА ---
-        elif home_code == "1":
-            if len(digits) == 10:
-                return True
-            if len(digits) == 11 and digits.startswith("1"):
-                return True
-            logger.debug(f"Phone {phone}: invalid US format")
+        # Для .ru домена ТОЛЬКО +7
+        if home_code == "7" and not digits.startswith("7"):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Phone {phone}: not Russian format for .ru domain")
             return False
 
-        logger.debug(f"Phone {phone}: no matching format for country code {home_code}")
-        return False
+        return True
 
     @classmethod
     def _is_valid_length_for_country(cls, digits: str, country_code: str, has_plus: bool = False) -> bool:
         """
         Проверяет, соответствует ли длина номера стандарту страны.
         """
-        from . import constants
+        # Допустимые длины для страны (одинаковы для номеров с плюсом и без)
+        valid_lengths = cls.COUNTRY_VALID_LENGTHS.get(country_code)
 
-        # Получаем стандарты для страны
-        standards = getattr(constants, "COUNTRY_PHONE_LENGTHS", {}).get(country_code, {})
-
-        if not standards:
+        if not valid_lengths:
             # Если нет точных стандартов - используем общие границы
             default_min = getattr(constants, "DEFAULT_MIN_LENGTH", 8)
             default_max = getattr(constants, "DEFAULT_MAX_LENGTH", 15)
             return default_min <= len(digits) <= default_max
 
-        valid_lengths = list(standards.values())
-
-        if has_plus:
-            return len(digits) in valid_lengths
-        else:
-            return len(digits) in valid_lengths
+        return len(digits) in valid_lengths
 
     @staticmethod
     def _is_sequential(digits: str) -> bool:
@@ -217,35 +380,27 @@ class PhoneValidator:
         if len(digits) < 6:
             return False
 
-        for i in range(len(digits) - 5):
-            segment = digits[i : i + 6]
-            if all(int(segment[j]) == (int(segment[0]) + j) % 10 for j in range(6)):
-                return True
-
-        for i in range(len(digits) - 5):
-            segment = digits[i : i + 6]
-            if all(int(segment[j]) == (int(segment[0]) - j) % 10 for j in range(6)):
-                return True
-
-        return False
+        return _SEQUENTIAL_RE.search(digits) is not None
 
     @staticmethod
     def _is_too_perfect(digits: str) -> bool:
         """Проверяет слишком 'идеальные' паттерны"""
 
         # Все цифры одинаковые
-        if len(set(digits)) == 1:
+        if digits and digits.count(digits[0]) == len(digits):
             return True
 
         # Чередующиеся цифры
-        if len(digits) >= 8 and len(set(digits[:2])) == 2:
+        if len(digits) >= 8 and digits[0] != digits[1]:
             pattern = digits[:2] * (len(digits) // 2)
             if pattern == digits[: len(pattern)]:
                 return True
 
-        # Палиндромы
-        if len(digits) >= 6 and digits == digits[::-1]:
-            return True
+        # Палиндромы: первая половина совпадает с перевёрнутой второй
+        if len(digits) >= 6:
+            half = len(digits) // 2
+            if digits[:half] == digits[: -half - 1 : -1]:
+                return True
 
         return False
 
@@ -257,43 +412,42 @@ class PhoneValidator:
         if not phone:
             return None
 
-        cleaned = cls._clean_phone(phone)
+        normalized = cls._normalize_cleaned(cls._clean_phone(phone), cls._get_home_code(current_url))
+        return normalized[0] if normalized else None
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_cleaned(cls, cleaned: str, home_code: Optional[str]) -> Optional[Tuple[str, str]]:
+        """
+        Нормализует очищенный номер.
+
+        Чистая функция без логирования - результат кэшируется: одни и те же
+        номера (шапка, подвал, контакты) повторяются на всех страницах сайта.
+
+        Returns:
+            Пара (номер в формате +XXX, код страны) или None
+        """
         if not cleaned:
             return None
 
         digits = cleaned.lstrip("+")
         has_plus = cleaned.startswith("+")
+        length = len(digits)
 
         # Проверка длины
-        if len(digits) < 7 or len(digits) > 15:
+        if length < 7 or length > 15:
             return None
 
-        # Получаем код страны из домена
-        home_code = None
-        if current_url:
-            try:
-                domain_parts = urlparse(current_url).netloc.split(".")
-                if len(domain_parts) >= 2:
-                    tld = domain_parts[-1].lower()
-                    home_code = cls.DOMAIN_COUNTRY_MAP.get(tld)
-            except Exception:
-                pass
-
         if has_plus:
             # Проверяем код страны
-            country_code = None
-            for code in sorted(cls.VALID_COUNTRY_CODES, key=len, reverse=True):
-                if digits.startswith(code):
-                    country_code = code
-                    break
-
+            country_code = cls._find_country_code(digits)
             if not country_code:
                 return None
 
             if not cls._is_valid_length_for_country(digits, country_code, has_plus=True):
                 return None
 
-            return cleaned
+            return cleaned, country_code
 
         if not home_code:
             return None
@@ -301,43 +455,14 @@ class PhoneValidator:
         if not cls._is_valid_length_for_country(digits, home_code, has_plus=False):
             return None
 
-        # Россия
-        if home_code == "7":
-            if len(digits) == 10 and digits.startswith("9"):
-                return "+7" + digits
-            if len(digits) == 11 and digits.startswith("8"):
-                return "+7" + digits[1:]
-            if len(digits) == 11 and digits.startswith("7"):
-                return "+" + digits
-            return None
-
-        # Беларусь
-        if home_code == "375":
-            if len(digits) == 12 and digits.startswith("375"):
-                return "+" + digits
-            if len(digits) == 9 and digits[:2] in ["25", "29", "33", "44", "17"]:
-                return "+375" + digits
-            if len(digits) == 12 and digits.startswith("375"):
-                return "+" + digits
+        normalizer = cls.LOCAL_NORMALIZERS.get(home_code)
+        if normalizer is None:
             return None
 
-        # Украина
-        if home_code == "380":
-            if len(digits) == 12 and digits.startswith("380"):
-                return "+" + digits
-            if len(digits) == 9:
-                return "+380" + digits
+        normalized = normalizer(digits)
+        if normalized is None:
             return None
-
-        # США
-        if home_code == "1":
-            if len(digits) == 10:
-                return "+1" + digits
-            if len(digits) == 11 and digits.startswith("1"):
-                return "+" + digits
-            return None
-
-        return None
+        return normalized, home_code
 
     @classmethod
     def validate_and_normalize_phones(cls, phones: Set[str], current_url: str = "") -> List[str]:
@@ -346,40 +471,102 @@ class PhoneValidator:
         """
         valid_phones = set()
 
+        # Код страны домена один на весь набор
+        home_code = cls._get_home_code(current_url)
+
+        # Локальные ссылки вместо поиска атрибутов класса на каждой итерации
+        clean_phone = cls._clean_phone
+        add_phone = valid_phones.add
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+        # Без debug-логов вердикт по очищенному номеру берётся из кэша,
+        # общего для всех страниц сайта
+        validate_cleaned = cls._validate_cleaned if debug_enabled else cls._validate_cleaned_cached
+
+        # Разные записи одного номера ("+7 (999) 123-45-67", "+79991234567")
+        # после очистки совпадают - полную проверку проходит каждый номер один раз
+        verdicts: Dict[str, Optional[str]] = {}
+
         for phone in phones:
-            normalized = cls.normalize_phone(phone, current_url)
-            if normalized and cls.is_likely_phone(normalized, current_url):
-                valid_phones.add(normalized)
-                logger.debug(f"Valid phone: {phone} -> {normalized}")
+            cleaned = clean_phone(phone)
+            if cleaned in verdicts:
+                result = verdicts[cleaned]
             else:
+                result = verdicts[cleaned] = validate_cleaned(cleaned, home_code)
+
+            if result:
+                add_phone(result)
+                if debug_enabled:
+                    logger.debug(f"Valid phone: {phone} -> {result}")
+            elif debug_enabled:
                 logger.debug(f"Invalid phone: {phone}")
 
-        return sorted(list(valid_phones))
+        return sorted(valid_phones)
 
+    @classmethod
+    def _validate_cleaned(cls, cleaned: str, home_code: Optional[str]) -> Optional[str]:
+        """Нормализует очищенный номер и проверяет результат"""
 
-class EmailValidator:
-    """Класс для валидации email адресов"""
+        normalized = cls._normalize_cleaned(cleaned, home_code)
+        # Номер уже очищен и код страны известен - повторно их не вычисляем
+        if normalized and cls._is_likely_normalized(*normalized, home_code):
+            return normalized[0]
+        return None
 
-    try:
-        KNOWN_GOOD_DOMAINS = constants.KNOWN_GOOD_EMAIL_DOMAINS
-    except AttributeError:
-        logger.warning("constants.KNOWN_GOOD_EMAIL_DOMAINS не найдена, использую базовый набор")
-        KNOWN_GOOD_DOMAINS = {
-            "gmail.com",
-            "mail.ru",
-            "yandex.ru",
-            "outlook.com",
-            "hotmail.com",
-            "yahoo.com",
-            "protonmail.com",
-            "icloud.com",
-        }
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _validate_cleaned_cached(cls, cleaned: str, home_code: Optional[str]) -> Optional[str]:
+        """Кэшируемый _validate_cleaned (используется без debug-логов)"""
+
+        return cls._validate_cleaned(cleaned, home_code)
+
+    @classmethod
+    def _is_likely_normalized(cls, normalized: str, country_code: str, home_code: Optional[str]) -> bool:
+        """Облегчённый is_likely_phone для результата _normalize_cleaned"""
+
+        digits = normalized[1:]
+        if not cls._passes_sanity_checks(normalized, digits, has_plus=True):
+            return False
+        return cls._is_likely_international(normalized, digits, country_code, home_code)
+
+
+# Базовые наборы доменов на случай, если в constants их нет
+_DEFAULT_KNOWN_GOOD_DOMAINS = frozenset(
+    {
+        "gmail.com",
+        "mail.ru",
+        "yandex.ru",
+        "outlook.com",
+        "hotmail.com",
+        "yahoo.com",
+        "protonmail.com",
+        "icloud.com",
+    }
+)
+_DEFAULT_BAD_DOMAINS = frozenset(
+    {"example.com", "example.ru", "test.com", "test.ru", "domain.com", "localhost", "invalid.com"}
+)
+
+
+def _domains_from_constants(name: str, default: FrozenSet[str]) -> FrozenSet[str]:
+    """Возвращает набор доменов из constants, а при его отсутствии - базовый набор"""
 
     try:
-        BAD_DOMAINS = constants.BAD_EMAIL_DOMAINS
+        return getattr(constants, name)
     except AttributeError:
-        logger.warning("constants.BAD_EMAIL_DOMAINS не найдена, использую базовый набор")
-        BAD_DOMAINS = {"example.com", "example.ru", "test.com", "test.ru", "domain.com", "localhost", "invalid.com"}
+        logger.warning(f"constants.{name} не найдена, использую базовый набор")
+        return default
+
+
+class EmailValidator:
+    """Класс для валидации email адресов"""
+
+    KNOWN_GOOD_DOMAINS = _domains_from_constants("KNOWN_GOOD_EMAIL_DOMAINS", _DEFAULT_KNOWN_GOOD_DOMAINS)
+    BAD_DOMAINS = _domains_from_constants("BAD_EMAIL_DOMAINS", _DEFAULT_BAD_DOMAINS)
+
+    # Допустимые символы (после приведения к нижнему регистру)
+    LOCAL_ALLOWED_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789._%+-"
+    DOMAIN_ALLOWED_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789.-"
 
     @classmethod
     def is_valid_email(cls, email: str) -> bool:
@@ -389,33 +576,37 @@ class EmailValidator:
             return False
 
         email = email.lower().strip()
-        try:
-            local_part, domain = email.split("@", 1)
-        except ValueError:
+
+        # Только ASCII: дальше все символьные проверки идут по байтам
+        if not email.isascii():
             return False
 
+        local_part, _, domain = email.partition("@")
+
         # Базовая проверка длины
         if len(local_part) > 64 or len(domain) > 255:
             return False
 
-        # Проверка домена
-        if "." not in domain:
-            return False
-        if domain.startswith(".") or domain.endswith("."):
+        # Проверка домена: есть точка, не в начале и не в конце
+        dot_pos = domain.rfind(".")
+        if dot_pos <= 0 or dot_pos == len(domain) - 1 or domain[0] == ".":
             return False
 
         # Проверка на тестовые домены
         if domain in cls.BAD_DOMAINS:
             return False
 
-        # Проверка формата
-        print(f"DEBUG: local='{local_part}' match={bool(re.match(r'^[a-zA-Z0-9._%+-]+$', local_part))}")
-        if not re.match(r"^[a-zA-Z0-9._%+-]+$", local_part):
+        # Проверка формата: допустимые символы проверяем через translate
+        local_bytes = local_part.encode("ascii")
+        if not local_bytes or local_bytes.translate(None, cls.LOCAL_ALLOWED_CHARS):
             return False
 
-        # if not re.match(r"^[a-zA-Z0-9._%+-]+$", local_part):
-        #     return False
-        if not re.match(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", domain):
+        if domain.encode("ascii").translate(None, cls.DOMAIN_ALLOWED_CHARS):
+            return False
+
+        # Доменная зона - минимум 2 буквы
+        tld = domain[dot_pos + 1 :]
+        if len(tld) < 2 or not tld.isalpha():
             return False
 
         return True
@@ -432,13 +623,8 @@ class EmailValidator:
     def validate_and_normalize_emails(cls, emails: Set[str]) -> List[str]:
         """Валидирует и нормализует набор email адресов"""
 
-        valid_emails = set()
-
-        for email in emails:
-            if not email:
-                continue
-            normalized = cls.normalize_email(email)
-            if cls.is_valid_email(normalized):
-                valid_emails.add(normalized)
+        # Одинаковые после нормализации адреса проверяются один раз
+        normalized = set(map(cls.normalize_email, filter(None, emails)))
+        is_valid_email = cls.is_valid_email
 
-        return sorted(list(valid_emails))
+        return sorted(email for email in normalized if is_valid_email(email))
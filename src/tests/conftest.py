@@ -0,0 +1,21 @@
+"""Общие фикстуры для тестов"""
+from types import SimpleNamespace
+
+import pytest
+
+from contact_parser.config import reset_logging
+
+
+@pytest.fixture(autouse=True)
+def isolated_logging():
+    """Сбрасывает корневой логгер после каждого теста"""
+
+    yield
+    reset_logging()
+
+
+@pytest.fixture
+def fake_contact_info():
+    """Лёгкая замена ContactInfo без найденных контактов"""
+
+    return SimpleNamespace(url="https://example.com", emails=[], phones=[])
@@ -0,0 +1,55 @@
+import pytest
+
+from contact_parser.extractors import DataExtractor
+from contact_parser.models import ParserSettings
+from contact_parser.validators import PhoneValidator
+
+# Бенчмарки запускаются только при установленном pytest-benchmark
+pytest.importorskip("pytest_benchmark")
+
+PAGE_HTML = """
+<html>
+    <head>
+        <meta name="telephone" content="+7 (495) 123-45-67">
+        <link rel="canonical" href="https://example.ru/contacts">
+        <script>var id = 1726730819; var phone = "+7 999 765-43-21";</script>
+    </head>
+    <body>
+        <p>Отдел продаж: manager@gmail.com, 8 (999) 123-45-67</p>
+        <p>US: +1-555-123-4567, UK: +44 20 7946 0958, BY: +375 29 616-77-77</p>
+        <a href="mailto:support@yandex.ru?subject=Вопрос">Написать</a>
+        <a href="tel:+79161234567">Позвонить</a>
+        <a href="/about">О компании</a>
+        <div data-email="hr@mail.ru" data-phone="+79031234567">Вакансии</div>
+    </body>
+</html>
+"""
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    """DataExtractor с валидацией телефонов"""
+
+    return DataExtractor(ParserSettings(enable_phone_validation=True))
+
+
+@pytest.mark.benchmark(group="extract_from_html")
+def test_benchmark_extract_from_html(benchmark, extractor):
+    """Бенчмарк полного извлечения данных со страницы"""
+
+    result = benchmark(extractor.extract_from_html, PAGE_HTML, "https://example.ru/contacts")
+
+    assert "manager@gmail.com" in result["emails"]
+    assert "+79991234567" in result["phones"]
+    assert "/about" in result["links"]
+
+
+@pytest.mark.benchmark(group="phone_validation")
+def test_benchmark_validate_and_normalize_phones(benchmark):
+    """Бенчмарк валидации набора телефонов"""
+
+    phones = {"+7 (999) 123-45-67", "8(916)1234567", "1726730819", "12345678", "+375296167777", "invalid"}
+
+    result = benchmark(PhoneValidator.validate_and_normalize_phones, phones, "https://example.ru")
+
+    assert result == ["+79161234567", "+79991234567"]
@@ -1,10 +1,11 @@
 import json
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from contact_parser.cli import create_parser, load_settings, process_url, save_to_json_file
+from contact_parser.cli import _get_parser, create_parser, load_settings, process_url, save_to_json_file
 from contact_parser.models import ParserSettings
 
 
@@ -30,6 +31,14 @@ class TestCLI:
         assert "--help" in help_text
         assert "Примеры использования" in help_text
 
+    def test_get_parser_cached(self):
+        """Тест повторного использования парсера аргументов в main"""
+
+        assert _get_parser() is _get_parser()
+
+        args = _get_parser().parse_args(["https://example.com"])
+        assert args.url == "https://example.com"
+
     def test_parser_url_argument(self):
         """Тест парсинга URL аргумента"""
 
@@ -185,14 +194,15 @@ class TestCLI:
         assert filepath.parent.exists()
         assert filepath.exists()
 
-    @patch("contact_parser.cli.ContactParser")
+    @patch("contact_parser.cli.ContactParser", autospec=True)
     def test_process_url_success(self, MockParser):
         """Тест успешной обработки URL"""
 
-        mock_contact_info = MagicMock()
-        mock_contact_info.url = "https://example.com"
-        mock_contact_info.emails = ["test@example.com"]
-        mock_contact_info.phones = ["+79991234567"]
+        mock_contact_info = SimpleNamespace(
+            url="https://example.com",
+            emails=["test@example.com"],
+            phones=["+79991234567"],
+        )
 
         mock_parser = MockParser.return_value
         mock_parser.parse_website.return_value = mock_contact_info
@@ -206,7 +216,7 @@ class TestCLI:
         MockParser.assert_called_once_with(settings)
         mock_parser.parse_website.assert_called_once_with("https://example.com")
 
-    @patch("contact_parser.cli.ContactParser")
+    @patch("contact_parser.cli.ContactParser", autospec=True)
     @patch("contact_parser.cli.logger")
     def test_process_url_error(self, mock_logger, MockParser):
         """Тест обработки URL с ошибкой"""
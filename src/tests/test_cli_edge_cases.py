@@ -1,4 +1,5 @@
 import logging
+from contextlib import ExitStack
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,45 +10,43 @@ from contact_parser.cli import load_settings, main
 class TestCLIEdgeCases:
     """Тесты для крайних случаев CLI"""
 
-    @patch("sys.argv", ["contact-parser"])
-    def test_main_no_args(self):
-        """Тест запуска без аргументов"""
-
-        with patch("sys.exit") as mock_exit:
-            main()
-            mock_exit.assert_called_once_with(1)
-
-    @patch("sys.argv", ["contact-parser", "https://example.com", "--config", "config.yaml"])
-    @patch("pathlib.Path.exists", return_value=False)
-    def test_main_config_not_found(self, mock_exists):
-        """Тест с несуществующим файлом конфигурации"""
-
-        with patch("sys.exit") as mock_exit:
-            main()
-            mock_exit.assert_called_once_with(1)
-
-    @patch("sys.argv", ["contact-parser", "--batch", "empty.txt"])
-    @patch("pathlib.Path.exists", return_value=True)
-    @patch("pathlib.Path.read_text", return_value="")
-    def test_main_batch_empty_file(self, mock_read, mock_exists):
-        """Тест с пустым файлом для пакетной обработки"""
+    @pytest.mark.parametrize(
+        "argv, patches",
+        [
+            (["contact-parser"], {}),
+            (
+                ["contact-parser", "https://example.com", "--config", "config.yaml"],
+                {"pathlib.Path.exists": False},
+            ),
+            (
+                ["contact-parser", "--batch", "empty.txt"],
+                {"pathlib.Path.exists": True, "pathlib.Path.read_text": ""},
+            ),
+        ],
+        ids=["no_args", "config_not_found", "batch_empty_file"],
+    )
+    def test_main_exits_with_error(self, argv, patches):
+        """Тест завершения с кодом 1 при некорректном запуске"""
+
+        with ExitStack() as stack:
+            stack.enter_context(patch("sys.argv", argv))
+            for target, value in patches.items():
+                stack.enter_context(patch(target, return_value=value))
+            mock_exit = stack.enter_context(patch("sys.exit", side_effect=SystemExit))
+
+            with pytest.raises(SystemExit):
+                main()
 
-        with patch("sys.exit") as mock_exit:
-            main()
-            mock_exit.assert_called_once_with(1)
+        mock_exit.assert_called_once_with(1)
 
     @patch("sys.argv", ["contact-parser", "https://example.com", "--quiet"])
     @patch("contact_parser.cli.setup_logging")
-    @patch("contact_parser.cli.ContactParser")
-    def test_main_quiet_mode(self, MockParser, mock_setup_logging):
+    @patch("contact_parser.cli.ContactParser", autospec=True)
+    def test_main_quiet_mode(self, MockParser, mock_setup_logging, fake_contact_info):
         """Тест тихого режима"""
 
         mock_parser = MockParser.return_value
-        mock_contact_info = MagicMock()
-        mock_contact_info.url = "https://example.com"
-        mock_contact_info.emails = []
-        mock_contact_info.phones = []
-        mock_parser.parse_website.return_value = mock_contact_info
+        mock_parser.parse_website.return_value = fake_contact_info
 
         with patch("sys.stdout") as mock_stdout:
             mock_stdout.write = MagicMock()
@@ -72,17 +71,12 @@ class TestCLIEdgeCases:
         with pytest.raises(SystemExit):
             load_settings(args)
 
-    @patch("contact_parser.cli.ContactParser")
-    def test_process_url_debug_logging(self, MockParser):
+    @patch("contact_parser.cli.ContactParser", autospec=True)
+    def test_process_url_debug_logging(self, MockParser, fake_contact_info):
         """Тест обработки URL с debug логированием"""
 
-        mock_contact_info = MagicMock()
-        mock_contact_info.url = "https://example.com"
-        mock_contact_info.emails = []
-        mock_contact_info.phones = []
-
         mock_parser = MockParser.return_value
-        mock_parser.parse_website.return_value = mock_contact_info
+        mock_parser.parse_website.return_value = fake_contact_info
 
         with patch("contact_parser.cli.logger") as mock_logger:
             mock_logger.isEnabledFor.return_value = True
@@ -94,17 +88,13 @@ class TestCLIEdgeCases:
             assert mock_logger.debug.called
             mock_logger.isEnabledFor.assert_called_with(logging.DEBUG)
 
-    def test_cli_verbose_mode_logging(self):
+    def test_cli_verbose_mode_logging(self, fake_contact_info):
         """Тест verbose режима с выводом настроек"""
         with patch("sys.argv", ["contact-parser", "https://example.com", "--verbose"]):
             with patch("contact_parser.cli.logger") as mock_logger:
-                with patch("contact_parser.cli.ContactParser") as MockParser:
+                with patch("contact_parser.cli.ContactParser", autospec=True) as MockParser:
                     mock_parser = MockParser.return_value
-                    mock_contact_info = MagicMock()
-                    mock_contact_info.url = "https://example.com"
-                    mock_contact_info.emails = []
-                    mock_contact_info.phones = []
-                    mock_parser.parse_website.return_value = mock_contact_info
+                    mock_parser.parse_website.return_value = fake_contact_info
 
                     main()
                     mock_logger.debug.assert_called()
@@ -125,6 +115,6 @@ class TestCLIEdgeCases:
         file_path = tmp_path / "test_output.json"
         data_to_save = {"emails": ["test@test.com"], "phones": []}
 
-        with patch("contact_parser.cli.open", side_effect=PermissionError("Доступ запрещен")):
+        with patch("contact_parser.output.open", side_effect=PermissionError("Доступ запрещен")):
             with pytest.raises(PermissionError):
                 save_to_json_file(data_to_save, file_path)
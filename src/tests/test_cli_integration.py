@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,7 +11,7 @@ class TestCLIIntegration:
 
     @patch("contact_parser.cli.argparse.ArgumentParser.parse_args")
     @patch("contact_parser.cli.setup_logging")
-    @patch("contact_parser.cli.ContactParser")
+    @patch("contact_parser.cli.ContactParser", autospec=True)
     def test_main_success(self, MockParser, mock_setup_logging, mock_parse_args):
         """Тест успешного запуска main"""
 
@@ -34,10 +35,11 @@ class TestCLIIntegration:
 
         # Мокаем парсер
         mock_parser = MockParser.return_value
-        mock_contact_info = MagicMock()
-        mock_contact_info.url = "https://example.com"
-        mock_contact_info.emails = ["test@example.com"]
-        mock_contact_info.phones = ["+79991234567"]
+        mock_contact_info = SimpleNamespace(
+            url="https://example.com",
+            emails=["test@example.com"],
+            phones=["+79991234567"],
+        )
         mock_parser.parse_website.return_value = mock_contact_info
 
         # Запускаем main
@@ -52,17 +54,13 @@ class TestCLIIntegration:
 
     @patch("sys.argv", ["contact-parser", "https://example.com", "--max-pages", "10"])
     @patch("contact_parser.cli.setup_logging")
-    @patch("contact_parser.cli.ContactParser")
-    def test_main_with_args(self, MockParser, mock_setup_logging):
+    @patch("contact_parser.cli.ContactParser", autospec=True)
+    def test_main_with_args(self, MockParser, mock_setup_logging, fake_contact_info):
         """Тест запуска с аргументами"""
 
         # Мокаем парсер
         mock_parser = MockParser.return_value
-        mock_contact_info = MagicMock()
-        mock_contact_info.url = "https://example.com"
-        mock_contact_info.emails = []
-        mock_contact_info.phones = []
-        mock_parser.parse_website.return_value = mock_contact_info
+        mock_parser.parse_website.return_value = fake_contact_info
 
         # Запускаем main
         with patch("sys.stdout") as mock_stdout:
@@ -71,14 +69,6 @@ class TestCLIIntegration:
 
         mock_setup_logging.assert_called_once()
 
-    def test_main_without_url(self):
-        """Тест запуска без URL"""
-
-        with patch("sys.argv", ["contact-parser"]):
-            with patch("sys.exit") as mock_exit:
-                main()
-                mock_exit.assert_called_once_with(1)
-
     @patch("sys.argv", ["contact-parser", "--help"])
     def test_main_help(self, capsys):
         """Тест вывода справки"""
@@ -92,24 +82,11 @@ class TestCLIIntegration:
             assert "Парсер сайта" in captured.out
             mock_exit.assert_called_once_with(0)
 
-    @patch("sys.argv", ["contact-parser", "--config", "nonexistent.yaml", "https://example.com"])
-    def test_main_config_file_not_found(self):
-        """Тест с несуществующим файлом конфигурации"""
-
-        with patch("sys.exit", side_effect=SystemExit) as mock_exit:
-            with patch("pathlib.Path.exists", return_value=False):
-                try:
-                    main()
-                except SystemExit:
-                    pass
-
-                mock_exit.assert_called_once_with(1)
-
     @patch("sys.argv", ["contact-parser", "--batch", "urls.txt", "--output", "results.json"])
     @patch("contact_parser.cli.setup_logging")
-    @patch("contact_parser.cli.ContactParser")
+    @patch("contact_parser.cli.ContactParser", autospec=True)
     @patch("pathlib.Path.exists", return_value=True)
-    def test_main_batch_mode(self, mock_exists, MockParser, mock_setup_logging, tmp_path):
+    def test_main_batch_mode(self, mock_exists, MockParser, mock_setup_logging, tmp_path, fake_contact_info):
         """Тест пакетного режима"""
 
         # Создаем временный файл с URL
@@ -120,11 +97,7 @@ class TestCLIIntegration:
         with patch("sys.argv", ["contact-parser", "--batch", str(batch_file), "--output", "results.json"]):
             # Мокаем парсер
             mock_parser = MockParser.return_value
-            mock_contact_info = MagicMock()
-            mock_contact_info.url = "https://example.com"
-            mock_contact_info.emails = []
-            mock_contact_info.phones = []
-            mock_parser.parse_website.return_value = mock_contact_info
+            mock_parser.parse_website.return_value = fake_contact_info
 
             # Мокаем save_to_json_file
             with patch("contact_parser.cli.save_to_json_file") as mock_save:
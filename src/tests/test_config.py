@@ -1,10 +1,11 @@
 """Тесты для модуля конфигурации"""
 import logging
+import logging.handlers
 import os
 
 import pytest
 
-from contact_parser.config import load_settings_from_env, load_settings_from_file, setup_logging
+from contact_parser.config import load_settings_from_env, load_settings_from_file, reset_logging, setup_logging
 
 
 class TestConfig:
@@ -13,10 +14,6 @@ class TestConfig:
     def test_setup_logging_default(self, capsys):
         """Тест настройки логирования по умолчанию"""
 
-        # Сначала сбросим все обработчики
-        for handler in logging.getLogger().handlers[:]:
-            logging.getLogger().removeHandler(handler)
-
         setup_logging(level="INFO")
 
         logger = logging.getLogger(__name__)
@@ -33,9 +30,6 @@ class TestConfig:
     def test_setup_logging_debug(self, capsys):
         """Тест настройки логирования с уровнем DEBUG"""
 
-        for handler in logging.getLogger().handlers[:]:
-            logging.getLogger().removeHandler(handler)
-
         setup_logging(level="DEBUG")
 
         logger = logging.getLogger(__name__)
@@ -49,9 +43,6 @@ class TestConfig:
 
         log_file = tmp_path / "test.log"
 
-        for handler in logging.getLogger().handlers[:]:
-            logging.getLogger().removeHandler(handler)
-
         setup_logging(level="INFO", log_file=str(log_file))
 
         logger = logging.getLogger(__name__)
@@ -67,46 +58,64 @@ class TestConfig:
         log_content = log_file.read_text(encoding="utf-8")
         assert "File test message" in log_content
 
+    def test_setup_logging_file_via_queue(self, tmp_path):
+        """Тест записи в файл через фоновый поток"""
+
+        log_file = tmp_path / "queue.log"
+
+        setup_logging(level="INFO", log_file=str(log_file))
+
+        queue_handlers = [
+            handler for handler in logging.getLogger().handlers if isinstance(handler, logging.handlers.QueueHandler)
+        ]
+        assert len(queue_handlers) == 1
+
+        logger = logging.getLogger(__name__)
+        for i in range(100):
+            logger.info("Queued message %d", i)
+
+        queue_handlers[0].flush()
+        log_content = log_file.read_text(encoding="utf-8")
+        assert "Queued message 0" in log_content
+        assert "Queued message 99" in log_content
+
+        reset_logging()
+        assert queue_handlers[0].listener._thread is None
+
     def test_setup_logging_silence_third_party(self):
         """Тест отключения логирования сторонних библиотек"""
 
-        for handler in logging.getLogger().handlers[:]:
-            logging.getLogger().removeHandler(handler)
-
         setup_logging(level="INFO")
 
         assert logging.getLogger("urllib3").level == logging.WARNING
         assert logging.getLogger("requests").level == logging.WARNING
         assert logging.getLogger("lxml").level == logging.WARNING
 
-    def test_load_settings_from_env(self, monkeypatch):
-        """Тест загрузки настроек из переменных окружения"""
+    def test_setup_logging_idempotent(self):
+        """Тест повторного вызова setup_logging с теми же параметрами"""
 
-        # Сохраняем старые значения
-        old_max_pages = os.environ.get("CONTACT_PARSER_MAX_PAGES")
-        old_timeout = os.environ.get("CONTACT_PARSER_TIMEOUT")
+        setup_logging(level="INFO")
+        handlers = list(logging.getLogger().handlers)
+
+        setup_logging(level="INFO")
+        assert logging.getLogger().handlers == handlers
+
+        setup_logging(level="INFO", force=True)
+        assert logging.getLogger().handlers != handlers
+        assert len(logging.getLogger().handlers) == len(handlers)
 
-        try:
-            monkeypatch.setenv("CONTACT_PARSER_MAX_PAGES", "100")
-            monkeypatch.setenv("CONTACT_PARSER_TIMEOUT", "30.0")
-            monkeypatch.setenv("CONTACT_PARSER_REQUEST_DELAY", "1.0")
+    def test_load_settings_from_env(self, monkeypatch):
+        """Тест загрузки настроек из переменных окружения"""
 
-            settings = load_settings_from_env()
+        monkeypatch.setenv("CONTACT_PARSER_MAX_PAGES", "100")
+        monkeypatch.setenv("CONTACT_PARSER_TIMEOUT", "30.0")
+        monkeypatch.setenv("CONTACT_PARSER_REQUEST_DELAY", "1.0")
 
-            assert settings.max_pages == 100
-            assert settings.timeout == 30.0
-            assert settings.request_delay == 1.0
-        finally:
-            # Восстанавливаем старые значения
-            if old_max_pages is not None:
-                monkeypatch.setenv("CONTACT_PARSER_MAX_PAGES", old_max_pages)
-            else:
-                monkeypatch.delenv("CONTACT_PARSER_MAX_PAGES", raising=False)
+        settings = load_settings_from_env()
 
-            if old_timeout is not None:
-                monkeypatch.setenv("CONTACT_PARSER_TIMEOUT", old_timeout)
-            else:
-                monkeypatch.delenv("CONTACT_PARSER_TIMEOUT", raising=False)
+        assert settings.max_pages == 100
+        assert settings.timeout == 30.0
+        assert settings.request_delay == 1.0
 
     def test_load_settings_from_file_python(self, tmp_path):
         """Тест загрузки настроек из Python файла"""
@@ -125,13 +134,51 @@ enable_email_validation = True"""
 
         settings = load_settings_from_file(str(config_file))
 
-        assert settings.max_pages == 200
-        assert settings.timeout == 60.0
-        assert settings.request_delay == 2.0
-        assert settings.max_workers == 8
-        assert settings.verify_ssl is False
-        assert settings.enable_phone_validation is True
-        assert settings.enable_email_validation is True
+        expected = {
+            "max_pages": 200,
+            "timeout": 60.0,
+            "request_delay": 2.0,
+            "max_workers": 8,
+            "verify_ssl": False,
+            "enable_phone_validation": True,
+            "enable_email_validation": True,
+        }
+        assert settings.model_dump(include=set(expected)) == expected
+
+    def test_load_settings_from_file_cached(self, tmp_path):
+        """Тест кэширования файла конфигурации до его изменения"""
+
+        config_file = tmp_path / "cached_config.py"
+        config_file.write_text("max_pages = 120")
+
+        first = load_settings_from_file(str(config_file))
+        second = load_settings_from_file(str(config_file))
+
+        assert first.max_pages == second.max_pages == 120
+        assert first is not second
+
+        stat = config_file.stat()
+        config_file.write_text("max_pages = 130")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_settings_from_file(str(config_file)).max_pages == 130
+
+    def test_load_settings_from_file_cache_key_resolved(self, tmp_path, monkeypatch):
+        """Тест: кэш конфигурации привязан к абсолютному пути файла"""
+
+        for name, max_pages in (("a", 140), ("b", 150)):
+            (tmp_path / name).mkdir()
+            config_file = tmp_path / name / "config.py"
+            config_file.write_text(f"max_pages = {max_pages}")
+            # Одинаковые время изменения и размер у файлов в разных каталогах
+            os.utime(config_file, ns=(0, 1_000_000_000))
+
+        monkeypatch.chdir(tmp_path / "a")
+        assert load_settings_from_file("config.py").max_pages == 140
+        assert load_settings_from_file("./config.py").max_pages == 140
+
+        monkeypatch.chdir(tmp_path / "b")
+        assert load_settings_from_file("config.py").max_pages == 150
 
     def test_load_settings_from_file_empty(self, tmp_path):
         """Тест загрузки настроек из пустого файла"""
@@ -168,11 +215,9 @@ timeout = 45.0"""
 
         settings = load_settings_from_file(str(config_file))
 
-        assert settings.max_pages == 150
-        assert settings.timeout == 45.0
         # Проверяем значения по умолчанию для других настроек
-        assert settings.request_delay == 0.2
-        assert settings.max_workers == 5
+        expected = {"max_pages": 150, "timeout": 45.0, "request_delay": 0.2, "max_workers": 5}
+        assert settings.model_dump(include=set(expected)) == expected
 
     def test_load_settings_from_file_invalid_content(self, tmp_path):
         """Тест загрузки настроек из файла с невалидным содержимым"""
@@ -15,10 +15,6 @@ class TestConfigEdgeCases:
     def test_setup_logging_file_error(self, capsys):
         """Тест ошибки при создании файла лога"""
 
-        root_logger = logging.getLogger()
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-
         import tempfile
 
         with tempfile.TemporaryDirectory() as tmp_dir:
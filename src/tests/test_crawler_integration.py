@@ -6,14 +6,34 @@ from contact_parser.crawler import WebsiteCrawler
 from contact_parser.models import ParserSettings
 
 
+def make_response(url, html):
+    """Создает мок HTTP-ответа с HTML-страницей"""
+    response = Mock(
+        status_code=200,
+        url=url,
+        text=html,
+        content=html.encode("utf-8"),
+        headers={"content-type": "text/html; charset=utf-8"},
+    )
+    response.raise_for_status = Mock()
+    return response
+
+
+@pytest.fixture(scope="module")
+def shared_crawler():
+    """Один экземпляр WebsiteCrawler на модуль"""
+    settings = ParserSettings(max_pages=5, timeout=5.0, request_delay=0, max_workers=1)
+    return WebsiteCrawler(settings)
+
+
 class TestWebsiteCrawlerIntegration:
     """Интеграционные тесты для WebsiteCrawler"""
 
     @pytest.fixture
-    def crawler(self):
-        """Создает экземпляр WebsiteCrawler для тестов"""
-        settings = ParserSettings(max_pages=5, timeout=5.0, request_delay=0, max_workers=1)
-        return WebsiteCrawler(settings)
+    def crawler(self, shared_crawler):
+        """Общий WebsiteCrawler с очищенным кэшем страниц"""
+        shared_crawler._cache.clear()
+        return shared_crawler
 
     @patch("requests.Session.get")
     def test_crawl_single_page(self, mock_get, crawler):
@@ -26,31 +46,21 @@ class TestWebsiteCrawlerIntegration:
             </body>
         </html>
         """
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "text/html; charset=utf-8"}
-        mock_response.url = "https://example.com"
-        mock_response.text = html_content
-        mock_response.content = html_content.encode("utf-8")  # Исправлено: не пустые байты
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response("https://example.com", html_content)
+        crawler.data_extractor._interned["old@gmail.com"] = "old@gmail.com"
 
         result = crawler.crawl("https://example.com", max_pages=1)
 
         assert len(result) == 1
         assert "test@gmail.com" in result[0]["emails"]
+        # Таблица интернирования не переживает предыдущий обход
+        assert "old@gmail.com" not in crawler.data_extractor._interned
 
     @patch("requests.Session.get")
-    def test_crawl_multiple_pages(self, mock_get, crawler):
+    def test_crawl_multiple_pages(self, mock_get, crawler, monkeypatch):
         """Тест обхода нескольких страниц"""
 
         def get_side_effect(url, **kwargs):
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.headers = {"content-type": "text/html; charset=utf-8"}
-            mock_response.url = url
-            mock_response.raise_for_status = Mock()
-
             if url.rstrip("/") == "https://example.com":
                 html = """
                 <html>
@@ -67,12 +77,10 @@ class TestWebsiteCrawlerIntegration:
             else:
                 html = "<html><body></body></html>"
 
-            mock_response.text = html
-            mock_response.content = html.encode("utf-8")
-            return mock_response
+            return make_response(url, html)
 
         mock_get.side_effect = get_side_effect
-        crawler.settings.enable_phone_validation = False
+        monkeypatch.setattr(crawler.settings, "enable_phone_validation", False)
 
         result = crawler.crawl("https://example.com", max_pages=3)
 
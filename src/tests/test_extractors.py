@@ -1,3 +1,4 @@
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,48 +8,70 @@ from contact_parser.models import ParserSettings
 from contact_parser.validators import EmailValidator, PhoneValidator
 
 
-class TestPhoneValidator:
-    """Тесты для PhoneValidator"""
-
-    def test_is_likely_phone_valid(self):
-        """Тест проверки валидных телефонов с контекстом домена"""
+@pytest.fixture(scope="class")
+def extractor_universal():
+    """Экземпляр DataExtractor с отключенной валидацией, свой для каждого класса"""
 
-        # Российские номера
-        assert PhoneValidator.is_likely_phone("+79991234567", "https://example.ru") is True
-        assert PhoneValidator.is_likely_phone("89991234567", "https://example.ru") is True
-        assert PhoneValidator.is_likely_phone("89161234567", "https://example.ru") is True
+    settings = ParserSettings(enable_phone_validation=False)
+    return DataExtractor(settings)
 
-        # Белорусские номера
-        assert PhoneValidator.is_likely_phone("+375296167777", "https://example.by") is True
-        assert PhoneValidator.is_likely_phone("375296167777", "https://example.by") is True
-        assert PhoneValidator.is_likely_phone("291234567", "https://example.by") is True
 
-        # Украинские номера
-        assert PhoneValidator.is_likely_phone("+380501234567", "https://example.ua") is True
-        assert PhoneValidator.is_likely_phone("501234567", "https://example.ua") is True
+@pytest.fixture(scope="class")
+def extractor():
+    """Экземпляр DataExtractor с валидацией телефонов, свой для каждого класса"""
 
-        # Американские номера
-        assert PhoneValidator.is_likely_phone("+15551234567", "https://example.com") is True
-        assert PhoneValidator.is_likely_phone("5551234567", "https://example.com") is True
+    settings = ParserSettings(enable_phone_validation=True)
+    return DataExtractor(settings)
 
-    def test_is_likely_phone_invalid(self):
-        """Тест проверки невалидных телефонов"""
 
-        # Слишком короткие
-        assert PhoneValidator.is_likely_phone("123") is False
-        assert PhoneValidator.is_likely_phone("") is False
+class TestPhoneValidator:
+    """Тесты для PhoneValidator"""
 
-        # ID товаров
-        assert PhoneValidator.is_likely_phone("1726730819", "https://example.ru") is False
-        assert PhoneValidator.is_likely_phone("4941234567", "https://example.ru") is False
+    @pytest.mark.parametrize(
+        "phone, url",
+        [
+            # Российские номера
+            ("+79991234567", "https://example.ru"),
+            ("89991234567", "https://example.ru"),
+            ("89161234567", "https://example.ru"),
+            # Белорусские номера
+            ("+375296167777", "https://example.by"),
+            ("375296167777", "https://example.by"),
+            ("291234567", "https://example.by"),
+            # Украинские номера
+            ("+380501234567", "https://example.ua"),
+            ("501234567", "https://example.ua"),
+            # Американские номера
+            ("+15551234567", "https://example.com"),
+            ("5551234567", "https://example.com"),
+        ],
+    )
+    def test_is_likely_phone_valid(self, phone, url):
+        """Тест проверки валидных телефонов с контекстом домена"""
 
-        # Невалидные коды стран
-        assert PhoneValidator.is_likely_phone("+71589871646", "https://example.ru") is False
-        assert PhoneValidator.is_likely_phone("+71127760297", "https://example.ru") is False
+        assert PhoneValidator.is_likely_phone(phone, url) is True
+
+    @pytest.mark.parametrize(
+        "phone, url",
+        [
+            # Слишком короткие
+            ("123", ""),
+            ("", ""),
+            # ID товаров
+            ("1726730819", "https://example.ru"),
+            ("4941234567", "https://example.ru"),
+            # Невалидные коды стран
+            ("+71589871646", "https://example.ru"),
+            ("+71127760297", "https://example.ru"),
+            # Последовательности
+            ("12345678", "https://example.ru"),
+            ("00000000", "https://example.ru"),
+        ],
+    )
+    def test_is_likely_phone_invalid(self, phone, url):
+        """Тест проверки невалидных телефонов"""
 
-        # Последовательности
-        assert PhoneValidator.is_likely_phone("12345678", "https://example.ru") is False
-        assert PhoneValidator.is_likely_phone("00000000", "https://example.ru") is False
+        assert PhoneValidator.is_likely_phone(phone, url) is False
 
     def test_normalize_phone_russian(self):
         """Тест нормализации российских телефонов"""
@@ -129,22 +152,23 @@ class TestPhoneValidatorAdvanced:
         assert PhoneValidator._clean_phone("abc") == ""
         assert PhoneValidator._clean_phone("+1+2+3") == "+123"
 
-    def test_is_sequential(self):
+    @pytest.mark.parametrize(
+        "digits, expected",
+        [("123456", True), ("234567", True), ("987654", True), ("123", False), ("111111", False)],
+    )
+    def test_is_sequential(self, digits, expected):
         """Тест проверки последовательных цифр"""
 
-        assert PhoneValidator._is_sequential("123456") is True
-        assert PhoneValidator._is_sequential("234567") is True
-        assert PhoneValidator._is_sequential("987654") is True
-        assert PhoneValidator._is_sequential("123") is False
-        assert PhoneValidator._is_sequential("111111") is False
+        assert PhoneValidator._is_sequential(digits) is expected
 
-    def test_is_too_perfect(self):
+    @pytest.mark.parametrize(
+        "digits, expected",
+        [("12121212", True), ("123321", True), ("111111", True), ("9161234567", False)],
+    )
+    def test_is_too_perfect(self, digits, expected):
         """Тест проверки 'идеальных' паттернов"""
 
-        assert PhoneValidator._is_too_perfect("12121212") is True
-        assert PhoneValidator._is_too_perfect("123321") is True
-        assert PhoneValidator._is_too_perfect("111111") is True
-        assert PhoneValidator._is_too_perfect("9161234567") is False
+        assert PhoneValidator._is_too_perfect(digits) is expected
 
     def test_is_valid_length_for_country(self):
         """Тест проверки длины по стандарту страны"""
@@ -165,43 +189,52 @@ class TestPhoneValidatorAdvanced:
         settings = ParserSettings(phone_patterns=["invalid[pattern", r"\d{3}-\d{2}-\d{2}"])
         extractor = DataExtractor(settings)
         assert len(extractor.phone_patterns) == 1
+        assert not extractor.phone_patterns[0].flags & re.ASCII
+
+    def test_phone_patterns_ascii_only_for_defaults(self):
+        """Тест: re.ASCII только у встроенных паттернов, пользовательские работают с кириллицей"""
+
+        default_patterns = DataExtractor(ParserSettings()).phone_patterns
+        assert all(pattern.flags & re.ASCII for pattern in default_patterns)
+        assert not any(pattern.search("١٢٣-٤٥٦-٧٨-٩٠") for pattern in default_patterns)
+
+        settings = ParserSettings(phone_patterns=["тел", r"\w+:\s*\d+"])
+        custom_patterns = DataExtractor(settings).phone_patterns
+        assert custom_patterns[0].search("ТЕЛ: 1")
+        assert custom_patterns[1].search("Телефон: 123").group() == "Телефон: 123"
 
 
 class TestEmailValidatorAdvanced:
     """Тесты для EmailValidator"""
 
-    def test_is_valid_email_edge_cases(self):
+    @pytest.mark.parametrize(
+        "email, expected",
+        [
+            # Валидные
+            ("test+filter@gmail.com", True),
+            ("user_name@real-domain.com", True),
+            ("first.last@real-domain.co.uk", True),
+            ("test@123.com", True),
+            ("test@example.technology", True),
+            # Невалидные
+            ("test@com", False),
+            ("test@.com", False),
+            ("@example.com", False),
+            ("test!@domain.com", False),
+            ("test@domain!.com", False),
+            # Длина
+            (f"{'a' * 65}@gmail.com", False),
+        ],
+    )
+    def test_is_valid_email_edge_cases(self, email, expected):
         """Тест валидации email (крайние случаи)"""
 
-        # Валидные
-        assert EmailValidator.is_valid_email("test+filter@gmail.com") is True
-        assert EmailValidator.is_valid_email("user_name@real-domain.com") is True
-        assert EmailValidator.is_valid_email("first.last@real-domain.co.uk") is True
-        assert EmailValidator.is_valid_email("test@123.com") is True
-        assert EmailValidator.is_valid_email("test@example.technology") is True
-
-        # Невалидные
-        assert EmailValidator.is_valid_email("test@com") is False
-        assert EmailValidator.is_valid_email("test@.com") is False
-        assert EmailValidator.is_valid_email("@example.com") is False
-        assert EmailValidator.is_valid_email("test!@domain.com") is False
-        assert EmailValidator.is_valid_email("test@domain!.com") is False
-
-        # Длина
-        long_local = "a" * 65
-        assert EmailValidator.is_valid_email(f"{long_local}@gmail.com") is False
+        assert EmailValidator.is_valid_email(email) is expected
 
 
 class TestDataExtractorAdvanced:
     """Тесты для DataExtractor"""
 
-    @pytest.fixture
-    def extractor_universal(self):
-        """Создает экземпляр DataExtractor с отключенной валидацией"""
-
-        settings = ParserSettings(enable_phone_validation=False)
-        return DataExtractor(settings)
-
     def test_extract_phones_universal(self, extractor_universal):
         """Тест универсального извлечения телефонов"""
 
@@ -242,29 +275,92 @@ class TestDataExtractorAdvanced:
         assert len(result["emails"]) >= 1
         assert len(result["phones"]) >= 2
 
+    def test_results_interned_across_pages(self, extractor_universal):
+        """Тест: одинаковые значения с разных страниц - один объект строки"""
 
-class TestDataExtractorCoverage:
-    @pytest.fixture
-    def extractor(self):
-        """Создает экземпляр DataExtractor для тестов"""
+        html = '<p>manager@gmail.com</p>\n<a href="/contacts">Контакты</a>'
+        first = extractor_universal.extract_from_html(html, "https://example.com/a")
+        second = extractor_universal.extract_from_html(html, "https://example.com/b")
+
+        (first_email,) = first["emails"]
+        (second_email,) = second["emails"]
+        assert first_email == second_email == "manager@gmail.com"
+        assert first_email is second_email
+
+        # Ссылки не интернируются, таблица хранит только email и телефоны
+        assert "/contacts" not in extractor_universal._interned
+
+        extractor_universal.clear_interned()
+        assert extractor_universal._interned == {}
+
+    def test_extract_batch(self, extractor_universal):
+        """Тест пакетного извлечения с сохранением порядка документов"""
 
-        settings = ParserSettings(enable_phone_validation=True)
-        return DataExtractor(settings)
+        htmls = [f"<p>user{i}@gmail.com</p>" for i in range(10)]
+        urls = [f"https://example{i}.com" for i in range(10)]
 
-    def test_extract_data_email_attribute(self, extractor):
+        results = extractor_universal.extract_batch(htmls, urls)
+
+        assert len(results) == 10
+        for i, result in enumerate(results):
+            assert result["emails"] == {f"user{i}@gmail.com"}
+        assert results == [extractor_universal.extract_from_html(h, u) for h, u in zip(htmls, urls)]
+
+        assert extractor_universal.extract_batch([]) == []
+
+        with pytest.raises(ValueError):
+            extractor_universal.extract_batch(htmls, urls[:1])
+
+    def test_extract_from_empty_html(self, extractor_universal):
+        """Тест: пустая страница не разбирается и не логируется как ошибка"""
+
+        with patch("contact_parser.extractors.logger") as mock_logger:
+            with patch.object(extractor_universal.html_parser, "parse_html") as mock_parse:
+                for html in ("", "   \n\t", b""):
+                    result = extractor_universal.extract_from_html(html)
+                    assert result == {"emails": set(), "phones": set(), "links": set()}
+
+        mock_parse.assert_not_called()
+        mock_logger.warning.assert_not_called()
+        mock_logger.error.assert_not_called()
+
+    def test_extract_from_bytes(self, extractor_universal):
+        """Тест разбора HTML, переданного в bytes"""
+
+        html = '<html><head><meta charset="utf-8"></head><body><p>Пишите:</p>\n<p>manager@gmail.com</p></body></html>'
+
+        result = extractor_universal.extract_from_html(html.encode("utf-8"))
+
+        assert result == extractor_universal.extract_from_html(html)
+        assert result["emails"] == {"manager@gmail.com"}
+
+    def test_warmup(self, extractor_universal):
+        """Тест прогрева: не оставляет служебных значений и не меняет результаты"""
+
+        html = "<p>manager@gmail.com</p>"
+        expected = extractor_universal.extract_from_html(html, "https://example.com")
+
+        extractor_universal.warmup()
+
+        assert "manager@gmail.com" not in extractor_universal._interned
+        assert extractor_universal.extract_from_html(html, "https://example.com") == expected
+
+
+class TestDataExtractorCoverage:
+    def test_extract_data_email_attribute(self, extractor, monkeypatch):
         html = '<div data-email="hidden@example.com">Contact</div>'
         from lxml import html as lxml_html
 
         tree = lxml_html.fromstring(html)
         assert tree.xpath("//*[@data-email]/@data-email") == ["hidden@example.com"]
-        extractor.settings.enable_email_validation = False
+        monkeypatch.setattr(extractor.settings, "enable_email_validation", False)
         result = extractor.extract_from_html(html)
         assert "hidden@example.com" in result["emails"]
 
-    def test_data_email_with_validation(self, extractor):
+    def test_data_email_with_validation(self, extractor, monkeypatch):
         """Тест data-email с включенной валидацией"""
 
-        extractor.settings.enable_email_validation = True
+        monkeypatch.setattr(extractor.settings, "enable_email_validation", True)
         html = '<div data-email="user_name@idomain.com">Contact</div>'
         result = extractor.extract_from_html(html)
         assert "user_name@idomain.com" in result["emails"]
@@ -293,7 +389,7 @@ class TestDataExtractorCoverage:
     def test_extract_emails_xpath_error(self, extractor):
         """Тест обработки ошибки XPath при извлечении email"""
 
-        with patch("lxml.html.HtmlElement.xpath", side_effect=Exception("XPath error")):
+        with patch("contact_parser.extractors._XP_MAILTO", side_effect=Exception("XPath error")):
             tree = extractor.html_parser.parse_html("<html></html>")
             result = extractor._extract_emails("", tree)
             assert result == set()
@@ -302,7 +398,7 @@ class TestDataExtractorCoverage:
         """Тест логирования ошибки XPath при извлечении email"""
 
         with patch("contact_parser.extractors.logger") as mock_logger:
-            with patch("lxml.html.HtmlElement.xpath", side_effect=Exception("XPath error")):
+            with patch("contact_parser.extractors._XP_MAILTO", side_effect=Exception("XPath error")):
                 tree = extractor.html_parser.parse_html("<html></html>")
                 result = extractor._extract_emails("", tree)
                 assert result == set()
@@ -311,7 +407,7 @@ class TestDataExtractorCoverage:
     def test_extract_phones_xpath_error(self, extractor):
         """Тест обработки ошибки XPath при извлечении телефонов"""
 
-        with patch("lxml.html.HtmlElement.xpath", side_effect=Exception("XPath error")):
+        with patch("contact_parser.extractors._XP_TEL", side_effect=Exception("XPath error")):
             result = extractor._extract_phones_with_validation("", None, "https://example.ru")
             assert result == set()
 
@@ -319,7 +415,7 @@ class TestDataExtractorCoverage:
         """Тест логирования ошибки XPath при извлечении телефонов"""
 
         with patch("contact_parser.extractors.logger") as mock_logger:
-            with patch("lxml.html.HtmlElement.xpath", side_effect=Exception("XPath error")):
+            with patch("contact_parser.extractors._XP_TEL", side_effect=Exception("XPath error")):
                 result = extractor._extract_phones_with_validation("", None, "https://example.ru")
                 assert result == set()
                 mock_logger.error.assert_called_once()
@@ -333,18 +429,27 @@ class TestDataExtractorCoverage:
             extractor._extract_phones_with_validation("", extractor.html_parser.parse_html(html), "https://example.ru")
             mock_logger.debug.assert_called()
 
-    def test_extract_phones_raw_with_tel(self, extractor):
+    def test_debug_messages_skipped_when_disabled(self, extractor):
+        """Тест: при выключенном debug сообщения не формируются"""
+
+        with patch("contact_parser.extractors.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            html = '<a href="tel:+79991234567">Call</a>'
+            extractor.extract_from_html(html, "https://example.ru")
+            mock_logger.debug.assert_not_called()
+
+    def test_extract_phones_raw_with_tel(self, extractor, monkeypatch):
         """Тест извлечения телефонов из tel ссылок в raw режиме"""
 
-        extractor.settings.enable_phone_validation = False
+        monkeypatch.setattr(extractor.settings, "enable_phone_validation", False)
         html = '<a href="tel:+79991234567">Call</a>'
         result = extractor.extract_from_html(html)
         assert len(result["phones"]) >= 1
 
-    def test_extract_phones_raw_with_tel_validation_off(self, extractor):
+    def test_extract_phones_raw_with_tel_validation_off(self, extractor, monkeypatch):
         """Тест raw режима с выключенной валидацией"""
 
-        extractor.settings.enable_phone_validation = False
+        monkeypatch.setattr(extractor.settings, "enable_phone_validation", False)
         html = '<a href="tel:+79991234567">Call</a>'
         result = extractor.extract_from_html(html)
         assert "+79991234567" in result["phones"]
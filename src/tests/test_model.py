@@ -121,14 +121,12 @@ class TestParserSettings:
         with pytest.raises(ValidationError):
             ParserSettings(timeout=0)  # Должно быть > 0
 
-    def test_environment_variables(self):
+    def test_environment_variables(self, monkeypatch):
         """Тест загрузки настроек из переменных окружения"""
 
-        import os
-
-        # Устанавливаем переменные окружения
-        os.environ["CONTACT_PARSER_MAX_PAGES"] = "100"
-        os.environ["CONTACT_PARSER_TIMEOUT"] = "20.0"
+        # Устанавливаем переменные окружения (monkeypatch вернёт их после теста)
+        monkeypatch.setenv("CONTACT_PARSER_MAX_PAGES", "100")
+        monkeypatch.setenv("CONTACT_PARSER_TIMEOUT", "20.0")
 
         # Создаем настройки
         settings = ParserSettings()
@@ -137,10 +135,6 @@ class TestParserSettings:
         assert settings.max_pages == 100
         assert settings.timeout == 20.0
 
-        # Очищаем переменные окружения
-        del os.environ["CONTACT_PARSER_MAX_PAGES"]
-        del os.environ["CONTACT_PARSER_TIMEOUT"]
-
     def test_email_pattern(self):
         """Тест паттерна для email"""
 
@@ -58,6 +58,19 @@ class TestURLNormalizerAdvanced:
         assert URLNormalizer.get_domain("") is None
         assert URLNormalizer.get_domain("not-a-url") is None
 
+    def test_domain_checks_cached(self):
+        """Тест кэширования проверок домена для повторяющихся ссылок"""
+
+        URLNormalizer.is_same_domain.cache_clear()
+        URLNormalizer.get_domain.cache_clear()
+
+        for _ in range(3):
+            assert URLNormalizer.is_same_domain("https://example.com/about", "example.com") is True
+            assert URLNormalizer.get_domain("") is None
+
+        assert URLNormalizer.is_same_domain.cache_info().hits == 2
+        assert URLNormalizer.get_domain.cache_info().hits == 2
+
 
 class TestHTMLParserAdvanced:
     """Расширенные тесты для HTMLParser"""
@@ -1,9 +1,18 @@
+import random
+import re
 from unittest.mock import patch
 
 import pytest
 
 from contact_parser import constants
-from contact_parser.validators import EmailValidator, PhoneValidator
+from contact_parser.validators import (
+    _DEFAULT_BAD_DOMAINS,
+    _DEFAULT_KNOWN_GOOD_DOMAINS,
+    _NOT_PHONE_RE,
+    EmailValidator,
+    PhoneValidator,
+    _domains_from_constants,
+)
 
 
 class TestPhoneValidator:
@@ -121,6 +130,92 @@ class TestPhoneValidatorAdvanced:
         constants.DEFAULT_MIN_LENGTH = original_min
         constants.DEFAULT_MAX_LENGTH = original_max
 
+    def test_find_country_code(self):
+        """Тест поиска кода страны по префиксу номера"""
+
+        assert PhoneValidator._find_country_code("79991234567") == "7"
+        assert PhoneValidator._find_country_code("375291234567") == "375"
+        assert PhoneValidator._find_country_code("441234567890") == "44"
+        assert PhoneValidator._find_country_code("15551234567") == "1"
+        assert PhoneValidator._find_country_code("0123456789") is None
+
+    def test_normalize_cleaned_is_cached(self):
+        """Тест кэширования нормализации очищенного номера"""
+
+        PhoneValidator._normalize_cleaned.cache_clear()
+        assert PhoneValidator.normalize_phone("8(999)1234567", "https://example.ru") == "+79991234567"
+        assert PhoneValidator.normalize_phone("8 999 123-45-67", "https://example.ru") == "+79991234567"
+
+        info = PhoneValidator._normalize_cleaned.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_phone_verdicts_cached_across_calls(self):
+        """Тест кэширования проверок номеров между страницами"""
+
+        PhoneValidator._check_cleaned_cached.cache_clear()
+        PhoneValidator._validate_cleaned_cached.cache_clear()
+
+        with patch("contact_parser.validators.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            for page in ("https://example.ru/", "https://example.ru/contacts"):
+                assert PhoneValidator.is_likely_phone("+7 (999) 123-45-67", page) is True
+                result = PhoneValidator.validate_and_normalize_phones({"8 (999) 123-45-67"}, page)
+                assert result == ["+79991234567"]
+
+        assert PhoneValidator._check_cleaned_cached.cache_info().hits == 1
+        assert PhoneValidator._validate_cleaned_cached.cache_info().hits == 1
+
+        # В debug-режиме кэш не используется, чтобы не терять сообщения
+        with patch("contact_parser.validators.logger") as mock_logger:
+            assert PhoneValidator.is_likely_phone("12345678", "https://example.ru") is False
+            mock_logger.debug.assert_any_call("Phone 12345678: matched NOT_PHONE pattern")
+        assert PhoneValidator._check_cleaned_cached.cache_info().currsize == 1
+
+    def test_not_phone_regex_matches_pattern_loop(self):
+        """Тест: объединённый NOT_PHONE regex совпадает с проверкой паттернов по одному"""
+
+        rng = random.Random(0)
+        candidates = {"12345678", "11111111", "0101010101", "9876543210", "1111122222"}
+        for length in range(1, 20):
+            candidates.update(digit * length for digit in "0123456789")
+            candidates.update("".join(rng.choice("0123456789") for _ in range(length)) for _ in range(50))
+            candidates.update("".join(rng.choice("01") for _ in range(length)) for _ in range(5))
+
+        for digits in candidates:
+            expected = any(re.match(pattern, digits) for pattern in constants.NOT_PHONE_PATTERNS)
+            assert bool(_NOT_PHONE_RE.match(digits)) is expected, digits
+
+    def test_clear_caches_applies_length_override(self, monkeypatch):
+        """Тест: после clear_caches действуют изменённые длины номеров"""
+
+        phone, url = "+375296167777", "https://example.by"
+        assert PhoneValidator.validate_and_normalize_phones({phone}, url) == [phone]
+
+        try:
+            monkeypatch.setitem(constants.COUNTRY_PHONE_LENGTHS, "375", {"full": 13})
+            PhoneValidator.clear_caches()
+
+            assert PhoneValidator.is_likely_phone(phone, url) is False
+            assert PhoneValidator.validate_and_normalize_phones({phone}, url) == []
+        finally:
+            monkeypatch.undo()
+            PhoneValidator.clear_caches()
+
+        assert PhoneValidator.validate_and_normalize_phones({phone}, url) == [phone]
+
+    def test_quick_length_reject_skips_cache(self):
+        """Тест быстрого отсева по длине без обращения к кэшу"""
+
+        PhoneValidator._check_cleaned_cached.cache_clear()
+
+        with patch("contact_parser.validators.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            for candidate in ("123456", "+12345", "1234567890123456", "+7999123456712345"):
+                assert PhoneValidator.is_likely_phone(candidate, "https://example.ru") is False
+
+        assert PhoneValidator._check_cleaned_cached.cache_info().currsize == 0
+
     def test_validate_and_normalize_phones(self):
         """Тест валидации и нормализации набора телефонов"""
 
@@ -215,6 +310,18 @@ class TestPhoneValidatorCountrySpecific:
     def test_country_specific_validation(self, phone, url, expected):
         assert PhoneValidator.is_likely_phone(phone, url) is expected
 
+    def test_local_validators_per_country(self):
+        """Тест специализированных проверок локальных номеров"""
+
+        assert set(PhoneValidator.LOCAL_VALIDATORS) == set(constants.LOCAL_PHONE_FORMATS)
+
+        assert PhoneValidator.LOCAL_VALIDATORS["7"]("9161234567") is True
+        assert PhoneValidator.LOCAL_VALIDATORS["7"]("5161234567") is False
+        assert PhoneValidator.LOCAL_VALIDATORS["375"]("291234567") is True
+        assert PhoneValidator.LOCAL_VALIDATORS["375"]("301234567") is False
+        assert PhoneValidator.LOCAL_VALIDATORS["1"]("5551234567") is True
+        assert PhoneValidator.LOCAL_VALIDATORS["1"]("25551234567") is False
+
     def test_domain_country_mapping(self):
         """Тест маппинга доменов в коды стран"""
 
@@ -299,10 +406,12 @@ class TestPhoneValidatorCountrySpecific:
 
         with patch("contact_parser.validators.constants") as mock_constants:
             delattr(mock_constants, "BAD_EMAIL_DOMAINS")  # Удаляем атрибут
-            from contact_parser.validators import EmailValidator
+            with patch("contact_parser.validators.logger") as mock_logger:
+                domains = _domains_from_constants("BAD_EMAIL_DOMAINS", _DEFAULT_BAD_DOMAINS)
 
-            validator = EmailValidator()
-            assert "example.com" in validator.BAD_DOMAINS
+        assert domains is _DEFAULT_BAD_DOMAINS
+        assert "example.com" in domains
+        mock_logger.warning.assert_called_once_with("constants.BAD_EMAIL_DOMAINS не найдена, использую базовый набор")
 
     def test_normalize_email_edge_cases(self):
         """Тест normalize_email с граничными случаями"""
@@ -320,9 +429,7 @@ class TestPhoneValidatorCountrySpecific:
     def test_is_valid_length_for_country_all_countries(self):
         """Тест проверки длины для всех стран из COUNTRY_PHONE_LENGTHS"""
 
-        from contact_parser.constants import COUNTRY_PHONE_LENGTHS
-
-        for country_code, standards in COUNTRY_PHONE_LENGTHS.items():
+        for country_code, standards in constants.COUNTRY_PHONE_LENGTHS.items():
             for length_name, length in standards.items():
                 digits = "1" * length
                 assert PhoneValidator._is_valid_length_for_country(digits, country_code, True) is True
@@ -399,18 +506,21 @@ class TestPhoneValidatorCountrySpecific:
             assert PhoneValidator.normalize_phone(input_phone, "https://example.ru") == expected
 
     def test_bad_domains_fallback_full(self):
-        """Тест fallback BAD_DOMAINS при импорте"""
+        """Тест fallback наборов доменов без перезагрузки модуля"""
 
         with patch("contact_parser.validators.constants") as mock_const:
             del mock_const.BAD_EMAIL_DOMAINS
+            del mock_const.KNOWN_GOOD_EMAIL_DOMAINS
 
-            import importlib
-
-            from contact_parser import validators
+            bad = _domains_from_constants("BAD_EMAIL_DOMAINS", _DEFAULT_BAD_DOMAINS)
+            good = _domains_from_constants("KNOWN_GOOD_EMAIL_DOMAINS", _DEFAULT_KNOWN_GOOD_DOMAINS)
 
-            importlib.reload(validators)
+        assert "example.com" in bad
+        assert "gmail.com" in good
 
-            assert "example.com" in validators.EmailValidator.BAD_DOMAINS
+        # Без подмены берутся наборы из constants
+        assert EmailValidator.BAD_DOMAINS is constants.BAD_EMAIL_DOMAINS
+        assert EmailValidator.KNOWN_GOOD_DOMAINS is constants.KNOWN_GOOD_EMAIL_DOMAINS
 
     def test_normalize_email_edge_cases_complete(self):
         """Тест normalize_email с граничными случаями"""